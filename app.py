@@ -7,26 +7,120 @@ Supports dynamic updates triggered via OBS WebSocket, StreamerBot, or REST API.
 __version__ = "0.8.6"
 
 import json
+import logging
 import os
+import sys
+import atexit
 import hashlib
+import hmac
+import operator
+import queue
+import random
+import re
+import secrets
+import socket
 import time
+import traceback
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from functools import wraps
+from types import MappingProxyType
+from functools import lru_cache, wraps
+from html import escape
 from threading import Thread
-from flask import Flask, render_template, jsonify, request, send_from_directory, redirect, url_for, flash, session
-from flask_socketio import SocketIO, emit
+from flask import Flask, render_template, jsonify, request, send_file, send_from_directory, redirect, url_for, flash, session
+from flask.json.provider import DefaultJSONProvider
+from flask_socketio import SocketIO, emit, join_room
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
+from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.utils import secure_filename
 import asyncio
-from thumbnail_service import get_thumbnail_service
+from thumbnail_service import get_thumbnail_service, THUMBNAIL_HTML_EXTENSIONS, THUMBNAIL_VIDEO_EXTENSIONS
 import websockets
 import threading
 from obswebsocket import obsws, requests, events
 
+# OBS scene-change event class and scene name getter, resolved once per protocol version.
+# obs-websocket-py events keep their payload in the `datain` dict (v5: 'sceneName', legacy v4: 'scene-name').
+SCENE_CHANGE_EVENTS = {
+    False: (events.CurrentProgramSceneChanged, operator.itemgetter('sceneName')),
+    True: (events.SwitchScenes, operator.itemgetter('scene-name')),
+}
+
+# Current-scene request class and response getter, resolved the same way
+# (v5 GetCurrentProgramScene: 'currentProgramSceneName', legacy v4 GetCurrentScene: 'name').
+CURRENT_SCENE_REQUESTS = {
+    False: (requests.GetCurrentProgramScene, operator.itemgetter('currentProgramSceneName')),
+    True: (requests.GetCurrentScene, operator.itemgetter('name')),
+}
+
+# GetSceneList response keys (current scene, per-scene name); the v5 response already carries
+# the current program scene, so one call answers both questions
+SCENE_LIST_FIELDS = {
+    False: ('currentProgramSceneName', 'sceneName'),
+    True: ('current-scene', 'name'),
+}
+
+# How long status polls may reuse a GetSceneList result (scene changes arrive as events meanwhile;
+# this only bounds how late added/renamed scenes show up)
+SCENE_SNAPSHOT_MAX_AGE = 30.0
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _OrjsonSocketIOJSON:
+    """json-module stand-in for Socket.IO packet encoding (orjson output is already compact)"""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+
+class _OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (keeps the default's key sorting and extra types)"""
+    
+    def _dump_bytes(self, obj, indent=False):
+        # Dates and dataclasses go through self.default so the output matches the stdlib provider
+        option = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj, kwargs.get('indent')).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # jsonify() path: hand the encoded bytes straight to the response (no str decode/re-encode)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._dump_bytes(obj, indent) + b'\n', mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = _OrjsonJSONProvider(app)
 app.config['SECRET_KEY'] = 'obs-tv-animator-secret-key'
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=1)
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Let a fronting proxy (nginx/Apache) stream files itself; only enable when such a proxy handles X-Sendfile
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+# Encode every Socket.IO/Engine.IO packet with orjson when it is installed
+socketio = SocketIO(app, cors_allowed_origins="*", json=_OrjsonSocketIOJSON if orjson is not None else None)
 
 # Initialize Flask-Login
 login_manager = LoginManager()
@@ -38,30 +132,142 @@ login_manager.login_message = 'Please log in to access the admin panel.'
 MAIN_PORT = int(os.environ.get('PORT', 8080))
 WEBSOCKET_PORT = MAIN_PORT + 1  # Raw WebSocket port is always main port + 1
 
+# Port the server is actually listening on, resolved once at import (it cannot change at runtime).
+# Development mode (via dev_local.py) uses Flask's default port 5000, production uses MAIN_PORT.
+CURRENT_PORT = 5000 if os.environ.get('FLASK_ENV') == 'development' else MAIN_PORT
+# Playwright loads animations from this server when capturing thumbnails
+THUMBNAIL_BASE_URL = f"http://localhost:{CURRENT_PORT}"
+
 def get_current_port():
     """Get the current server port based on environment (development vs production)"""
-    # Development mode (via dev_local.py) uses Flask's default port 5000
-    if os.environ.get('FLASK_ENV') == 'development':
-        return 5000
-    # Production mode uses the configured MAIN_PORT
-    return MAIN_PORT
-
-ANIMATIONS_DIR = Path(__file__).parent / "animations"
-VIDEOS_DIR = Path(__file__).parent / "videos"
-DATA_DIR = Path(__file__).parent / "data"
+    return CURRENT_PORT
+
+BASE_DIR = Path(__file__).parent
+ANIMATIONS_DIR = BASE_DIR / "animations"
+VIDEOS_DIR = BASE_DIR / "videos"
+DATA_DIR = BASE_DIR / "data"
 CONFIG_DIR = DATA_DIR / "config"  # Config now under data directory
 LOGS_DIR = DATA_DIR / "logs"      # Logs now under data directory
 THUMBNAILS_DIR = DATA_DIR / "thumbnails"  # Thumbnails directory
 STATE_FILE = DATA_DIR / "state.json"
 USERS_FILE = CONFIG_DIR / "users.json"
+OBS_SETTINGS_FILE = CONFIG_DIR / "obs_settings.json"
+OBS_CURRENT_SCENE_FILE = CONFIG_DIR / "obs_current_scene.json"
+OBS_MAPPINGS_FILE = CONFIG_DIR / "obs_mappings.json"
+TRIGGER_SOCKET_PATH = os.environ.get('TRIGGER_SOCKET', str(DATA_DIR / "trigger.sock"))
+
+# String forms for C-level APIs (os.scandir, send_from_directory) on per-request paths
+ANIMATIONS_DIR_STR = str(ANIMATIONS_DIR)
+VIDEOS_DIR_STR = str(VIDEOS_DIR)
+
+# Logging - messages are formatted lazily, so disabled levels cost almost nothing
+logger = logging.getLogger('obs_tv_animator')
+
+
+_log_listener = None
+
+
+def setup_logging():
+    """Configure console and rotating file logging (LOG_LEVEL env var overrides the default level)
+    
+    Records are handed to a QueueHandler; a QueueListener thread formats them and does the
+    console/file I/O, so socket handlers and the event loops never block on stdout or disk.
+    """
+    global _log_listener
+    if logger.handlers:
+        return logger
+    default_level = 'DEBUG' if os.environ.get('FLASK_ENV') == 'development' else 'WARNING'
+    logger.setLevel(os.environ.get('LOG_LEVEL', default_level).upper())
+    logger.propagate = False
+
+    formatter = logging.Formatter('%(asctime)s.%(msecs)03d %(levelname)s %(message)s', datefmt='%H:%M:%S')
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+
+    file_error = None
+    try:
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(LOGS_DIR / "obs_tv_animator.log", maxBytes=1024 * 1024,
+                                           backupCount=3, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    except OSError as e:
+        file_error = e
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    # Flush whatever is still queued when the interpreter exits
+    atexit.register(_log_listener.stop)
+
+    if file_error is not None:
+        logger.warning("⚠️ File logging disabled, could not open log file: %s", file_error)
+    return logger
+
+
+setup_logging()
+
+# Shared asyncio loop for housekeeping tasks (file watchers, OBS connection monitor, reconnects)
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+
+def _new_event_loop():
+    """Create a new event loop, using uvloop when it is installed"""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def get_background_loop():
+    """Return the shared background event loop, starting its thread on first use"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = _new_event_loop()
+            Thread(target=loop.run_forever, name='background-loop', daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def _log_background_failure(future):
+    """Log exceptions from background tasks that would otherwise be silently dropped"""
+    if not future.cancelled() and future.exception():
+        logger.error("❌ Background task failed: %s", future.exception())
+
+
+def run_in_background(coro):
+    """Schedule a coroutine on the shared background loop and return its concurrent future"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    future.add_done_callback(_log_background_failure)
+    return future
+
+
+def stop_background_loop():
+    """Stop the shared background loop, which ends every housekeeping task at once"""
+    with _background_loop_lock:
+        if _background_loop is not None and _background_loop.is_running():
+            _background_loop.call_soon_threadsafe(_background_loop.stop)
+
 
 # Supported file extensions
 HTML_EXTENSIONS = {'.html', '.htm'}
 VIDEO_EXTENSIONS = {'.mp4', '.webm', '.ogg', '.avi', '.mov', '.mkv'}
+# Tuple forms for fast str.endswith() checks on lowercased filenames
+HTML_EXT_TUPLE = tuple(sorted(HTML_EXTENSIONS))
+VIDEO_EXT_TUPLE = tuple(sorted(VIDEO_EXTENSIONS))
+SUPPORTED_UPLOAD_TYPES = tuple(sorted(HTML_EXTENSIONS | VIDEO_EXTENSIONS))  # Listed in upload type errors
+UPLOAD_COPY_BUFFER = 1024 * 1024  # Copy uploads to disk in 1 MiB chunks (large videos)
 
 # Connected devices tracking
 connected_devices = {}  # {session_id: {'type': 'tv'|'admin', 'user_agent': str, 'connected_at': timestamp}}
 admin_sessions = set()  # Track admin dashboard sessions
+ADMIN_ROOM = 'admins'  # Socket.IO room joined by admin dashboards
+DEVICES_UPDATE_DELAY = 0.1  # Coalesce bursts of connects/disconnects into one devices_updated emit
+_devices_update_lock = threading.Lock()
+_devices_update_pending = False
 
 # OBS WebSocket client and scene watcher
 obs_client = None
@@ -76,7 +282,7 @@ class User(UserMixin):
 @login_manager.user_loader
 def load_user(username):
     """Load user for Flask-Login"""
-    users_data = load_users_config()
+    users_data = _get_users_cached()
     if username in users_data.get('admin_users', {}):
         return User(username)
     return None
@@ -84,11 +290,11 @@ def load_user(username):
 def load_users_config():
     """Load users configuration from file"""
     try:
-        if USERS_FILE.exists():
-            with open(USERS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        return _read_json_file(USERS_FILE)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        print(f"Error loading users config: {e}")
+        logger.error("Error loading users config: %s", e)
     
     # Default config if file doesn't exist
     return {
@@ -101,15 +307,42 @@ def load_users_config():
         }
     }
 
-def verify_password(username, password):
-    """Verify user password"""
-    users_data = load_users_config()
-    admin_users = users_data.get('admin_users', {})
+def _get_users_cached():
+    """Users config for read-only lookups, re-parsed only when users.json changes (do not mutate)"""
+    try:
+        return _read_json_cached(USERS_FILE)
+    except Exception:
+        return load_users_config()
+
+
+def _get_user_theme(username):
+    """Get a user's theme preference (defaults to dark)"""
+    try:
+        return _get_users_cached().get('admin_users', {}).get(username, {}).get('theme', 'dark')
+    except Exception as e:
+        logger.warning("Error loading theme for '%s': %s", username, e)
+        return 'dark'
+
+def _check_user_password(user_info, password):
+    """Check a password against a user record (salted hash, or legacy plain-text entry)"""
+    password_hash = user_info.get('password_hash')
+    if password_hash:
+        return check_password_hash(password_hash, password)
+    
+    # Legacy plain-text entry - constant-time compare, upgraded to a hash on next login
+    stored_password = user_info.get('password')
+    if stored_password is None:
+        return False
+    return hmac.compare_digest(stored_password.encode('utf-8'), password.encode('utf-8'))
+
+def verify_password(username, password, users_data=None):
+    """Verify user password (pass users_data to reuse an already loaded config)"""
+    if users_data is None:
+        users_data = _get_users_cached()
+    user_info = users_data.get('admin_users', {}).get(username)
     
-    if username in admin_users:
-        stored_password = admin_users[username]['password']
-        # In production, you'd want to hash passwords
-        return stored_password == password
+    if user_info:
+        return _check_user_password(user_info, password)
     
     return False
 
@@ -163,7 +396,7 @@ def get_connected_devices_info():
                 })
             except Exception as e:
                 # Handle case where client connection info is not available
-                print(f"Error getting StreamerBot client info: {e}")
+                logger.warning("Error getting StreamerBot client info: %s", e)
     
     streamerbot_count = len(streamerbot_devices)
     
@@ -177,6 +410,25 @@ def get_connected_devices_info():
     }
 
 
+def _emit_devices_update():
+    """Background task: wait for the burst to settle, then send one device list to admins"""
+    global _devices_update_pending
+    socketio.sleep(DEVICES_UPDATE_DELAY)
+    with _devices_update_lock:
+        _devices_update_pending = False
+    socketio.emit('devices_updated', get_connected_devices_info(), room=ADMIN_ROOM)
+
+
+def schedule_devices_update():
+    """Queue a devices_updated broadcast to admin dashboards, merging updates that arrive close together"""
+    global _devices_update_pending
+    with _devices_update_lock:
+        if _devices_update_pending:
+            return
+        _devices_update_pending = True
+    socketio.start_background_task(_emit_devices_update)
+
+
 def get_tv_devices_count():
     """Get count of connected TV devices (excluding admin)"""
     return len([d for d in connected_devices.values() if d['type'] == 'tv'])
@@ -188,14 +440,14 @@ class TriggerFileWatcher:
         self.trigger_file_path = trigger_file_path
         self.last_modified = 0
         self.running = True
+        self.watch_task = None
         
     def start_watching(self):
-        """Start watching the trigger file in a background thread"""
-        thread = Thread(target=self._watch_file, daemon=True)
-        thread.start()
-        print(f"🔍 Started watching trigger file: {self.trigger_file_path}")
+        """Start watching the trigger file on the shared background loop"""
+        self.watch_task = run_in_background(self._watch_file())
+        logger.info("🔍 Started watching trigger file: %s", self.trigger_file_path)
         
-    def _watch_file(self):
+    async def _watch_file(self):
         """Watch for changes to the trigger file"""
         while self.running:
             try:
@@ -210,16 +462,16 @@ class TriggerFileWatcher:
                             animation_name = f.read().strip()
                             
                         if animation_name:
-                            print(f"📂 File trigger received: {animation_name}")
+                            logger.info("📂 File trigger received: %s", animation_name)
                             self._handle_trigger(animation_name)
                             
                         # Delete the file after processing
                         os.remove(self.trigger_file_path)
                         
             except Exception as e:
-                print(f"Error watching trigger file: {e}")
+                logger.error("Error watching trigger file: %s", e)
                 
-            time.sleep(0.1)  # Check every 100ms for fast response
+            await asyncio.sleep(0.1)  # Check every 100ms for fast response
             
     def _handle_trigger(self, animation_name):
         """Handle the animation trigger"""
@@ -227,7 +479,7 @@ class TriggerFileWatcher:
             # Validate that the media file exists
             media_path, media_type = find_media_file(animation_name)
             if not media_path:
-                print(f"❌ Media file '{animation_name}' not found")
+                logger.warning("❌ Media file '%s' not found", animation_name)
                 return
                 
             # Update state
@@ -235,29 +487,91 @@ class TriggerFileWatcher:
             state['current_animation'] = animation_name
             save_state(state)
 
-            # Emit animation change to all clients
-            socketio.emit('animation_changed', {
-                'current_animation': animation_name,
-                'media_type': media_type,
-                'message': f"Media changed to '{animation_name}' ({media_type}) via file trigger",
-                'refresh_page': True
-            })
-
-            # Emit explicit page refresh
-            socketio.emit('page_refresh', {
-                'reason': 'file_trigger',
-                'new_media': animation_name,
-                'media_type': media_type
-            })
+            # Emit animation change (with page refresh request) to all clients
+            broadcast_media_change(animation_name, media_type,
+                                   f"Media changed to '{animation_name}' ({media_type}) via file trigger",
+                                   reason='file_trigger')
 
-            print(f"✅ Successfully triggered animation: {animation_name} ({media_type})")
+            logger.info("✅ Successfully triggered animation: %s (%s)", animation_name, media_type)
             
         except Exception as e:
-            print(f"❌ Error handling trigger: {e}")
+            logger.error("❌ Error handling trigger: %s", e)
             
     def stop_watching(self):
         """Stop watching the trigger file"""
         self.running = False
+        if self.watch_task:
+            self.watch_task.cancel()
+
+
+class _TriggerDatagramProtocol(asyncio.DatagramProtocol):
+    """Hand each received datagram (an animation name) to the trigger handler"""
+    def __init__(self, handler):
+        self.handler = handler
+    
+    def datagram_received(self, data, addr):
+        animation_name = data.decode('utf-8', errors='replace').strip()
+        if animation_name:
+            logger.info("📨 Socket trigger received: %s", animation_name)
+            self.handler(animation_name)
+    
+    def error_received(self, exc):
+        logger.error("❌ Trigger socket error: %s", exc)
+
+
+class TriggerSocketListener:
+    """Receive StreamerBot triggers on a Unix datagram socket (no polling, no temp files)
+    
+    Send the animation name as a single datagram, e.g.
+    `socat - UNIX-SENDTO:data/trigger.sock <<< anim1.html`. Platforms without
+    AF_UNIX (Windows) keep using the trigger.txt file watcher.
+    """
+    def __init__(self, socket_path, handler):
+        self.socket_path = str(socket_path)
+        self.handler = handler
+        self.transport = None
+    
+    @staticmethod
+    def is_supported():
+        """Unix domain sockets are unavailable on Windows"""
+        return hasattr(socket, 'AF_UNIX')
+    
+    def start_listening(self):
+        """Bind the socket and start receiving on the shared background loop"""
+        if not self.is_supported():
+            logger.info("ℹ️ Unix sockets not available, trigger socket disabled")
+            return False
+        run_in_background(self._listen())
+        return True
+    
+    async def _listen(self):
+        """Bind the datagram socket and attach it to the running loop"""
+        # Remove a stale socket left behind by a previous run
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind(self.socket_path)
+        except OSError as e:
+            sock.close()
+            logger.error("❌ Could not bind trigger socket %s: %s", self.socket_path, e)
+            return
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: _TriggerDatagramProtocol(self.handler), sock=sock)
+        logger.info("🔍 Listening for triggers on socket: %s", self.socket_path)
+    
+    def stop_listening(self):
+        """Close the socket and remove its file"""
+        if self.transport:
+            get_background_loop().call_soon_threadsafe(self.transport.close)
+            self.transport = None
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
 
 
 class OBSSceneWatcher:
@@ -267,68 +581,69 @@ class OBSSceneWatcher:
         self.scene_file_path = Path(scene_file_path)
         self.mappings_file_path = Path(mappings_file_path)
         self.running = False
-        self.watch_thread = None
+        self.watch_task = None
         self.last_scene = None
         self.last_modified = 0
         
-        print(f"🎬 OBS Scene Watcher initialized:")
-        print(f"   Scene file: {self.scene_file_path}")
-        print(f"   Mappings file: {self.mappings_file_path}")
+        logger.info("🎬 OBS Scene Watcher initialized (scene file: %s, mappings file: %s)",
+                    self.scene_file_path, self.mappings_file_path)
     
     def start_watching(self):
         """Start watching the OBS scene file for changes"""
         if self.running:
-            print("⚠️ OBS Scene Watcher is already running")
+            logger.warning("⚠️ OBS Scene Watcher is already running")
             return
             
         self.running = True
-        self.watch_thread = Thread(target=self._watch_scene_file, daemon=True)
-        self.watch_thread.start()
-        print("🎬 OBS Scene Watcher started successfully")
+        self.watch_task = run_in_background(self._watch_scene_file())
+        logger.info("🎬 OBS Scene Watcher started successfully")
     
-    def _watch_scene_file(self):
+    async def _watch_scene_file(self):
         """Watch the scene file for changes and trigger animations"""
-        print("👀 OBS Scene Watcher monitoring started...")
+        logger.info("👀 OBS Scene Watcher monitoring started...")
         
         while self.running:
             try:
-                if self.scene_file_path.exists():
+                # One stat per poll: a missing file just means no scene has been stored yet
+                try:
+                    current_modified = os.stat(self.scene_file_path).st_mtime
+                except FileNotFoundError:
+                    current_modified = None
+                
+                if current_modified is not None:
                     # Check if file was modified
-                    current_modified = self.scene_file_path.stat().st_mtime
-                    
                     if current_modified > self.last_modified:
                         self.last_modified = current_modified
-                        print(f"🎬 [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Scene file changed detected")
+                        logger.debug("🎬 Scene file change detected")
                         
-                        # Read the current scene
+                        # Read the current scene (write_current_scene seeds the JSON cache, so this skips the parse)
                         try:
-                            with open(self.scene_file_path, 'r', encoding='utf-8') as f:
-                                scene_data = json.load(f)
-                                current_scene = scene_data.get('current_scene')
+                            scene_data = _read_json_cached(self.scene_file_path)
+                            current_scene = scene_data.get('current_scene')
                                 
                             if current_scene and current_scene != self.last_scene:
-                                print(f"🎬 Scene change detected: '{self.last_scene}' → '{current_scene}'")
+                                logger.info("🎬 Scene change detected: '%s' → '%s'", self.last_scene, current_scene)
                                 self.last_scene = current_scene
                                 self._handle_scene_change(current_scene)
                                 
-                        except (json.JSONDecodeError, KeyError, Exception) as e:
-                            print(f"❌ Error reading scene file: {e}")
+                        except (OSError, ValueError) as e:
+                            logger.error("❌ Error reading scene file: %s", e)
                 
-                time.sleep(0.1)  # Check every 100ms for responsiveness
+                await asyncio.sleep(0.1)  # Check every 100ms for responsiveness
                 
             except Exception as e:
-                print(f"❌ Scene watcher error: {e}")
-                time.sleep(1)  # Wait longer on errors
+                logger.error("❌ Scene watcher error: %s", e)
+                await asyncio.sleep(1)  # Wait longer on errors
     
     def _handle_scene_change(self, scene_name):
         """Handle a scene change by checking mappings and triggering animations"""
         try:
-            print(f"🎭 Processing scene change: '{scene_name}'")
+            logger.debug("🎭 Processing scene change: '%s'", scene_name)
             
             # Load current scene mappings
             mappings = self._load_scene_mappings()
             if not mappings:
-                print("ℹ️ No scene mappings configured")
+                logger.info("ℹ️ No scene mappings configured")
                 return
             
             # Find matching animation for this scene
@@ -339,85 +654,59 @@ class OBSSceneWatcher:
                     break
             
             if animation_name:
-                print(f"🎭 Found mapping: '{scene_name}' → '{animation_name}'")
+                logger.info("🎭 Found mapping: '%s' → '%s'", scene_name, animation_name)
                 self._trigger_animation(animation_name, scene_name)
             else:
-                print(f"ℹ️ No animation mapping found for scene '{scene_name}'")
+                logger.info("ℹ️ No animation mapping found for scene '%s'", scene_name)
                 
         except Exception as e:
-            print(f"❌ Error handling scene change: {e}")
+            logger.error("❌ Error handling scene change: %s", e)
     
     def _load_scene_mappings(self):
-        """Load scene mappings from the mappings file"""
-        try:
-            if self.mappings_file_path.exists():
-                with open(self.mappings_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Handle both formats: direct array or wrapped in 'mappings' key
-                    if isinstance(data, list):
-                        mappings = data
-                    else:
-                        mappings = data.get('mappings', [])
-                    print(f"📋 Loaded {len(mappings)} scene mappings")
-                    return mappings
-            else:
-                print("⚠️ Scene mappings file not found")
-                return []
-        except Exception as e:
-            print(f"❌ Error loading scene mappings: {e}")
-            return []
+        """Load scene mappings from the mappings file (cached until the file changes)"""
+        mappings = read_obs_mappings(self.mappings_file_path)
+        logger.debug("📋 Loaded %d scene mappings", len(mappings))
+        return mappings
     
     def _trigger_animation(self, animation_name, scene_name):
         """Trigger an animation by directly updating state and emitting SocketIO commands"""
         try:
-            print(f"🎬 Triggering animation '{animation_name}' for scene '{scene_name}'")
+            logger.debug("🎬 Triggering animation '%s' for scene '%s'", animation_name, scene_name)
             
             # Validate that the media file exists
             media_path, media_type = find_media_file(animation_name)
             if not media_path:
-                print(f"❌ Animation file '{animation_name}' not found")
+                logger.warning("❌ Animation file '%s' not found", animation_name)
                 return
             
             # Update state directly (same as /trigger route)
             state = load_state()
             state['current_animation'] = animation_name
             save_state(state)
-            print(f"💾 Updated backend state to: {animation_name}")
+            logger.debug("💾 Updated backend state to: %s", animation_name)
             
             # Import socketio from the global scope
             global socketio
             if socketio:
                 # Emit animation change to all clients (same as /trigger route)
-                socketio.emit('animation_changed', {
-                    'current_animation': animation_name,
-                    'media_type': media_type,
-                    'message': f"Media changed to '{animation_name}' ({media_type})",
-                    'refresh_page': True
-                })
-                print(f"📡 [AUTO-TRIGGER] Emitted 'animation_changed' for '{animation_name}' with refresh_page=True")
-
-                # Emit explicit page refresh (same as /trigger route)
-                socketio.emit('page_refresh', {
-                    'reason': 'media_changed',
-                    'new_media': animation_name,
-                    'media_type': media_type
-                })
-                print(f"📡 [AUTO-TRIGGER] Emitted 'page_refresh' for '{animation_name}' - TV should reload now")
+                broadcast_media_change(animation_name, media_type,
+                                       f"Media changed to '{animation_name}' ({media_type})")
+                logger.debug("📡 [AUTO-TRIGGER] Emitted 'animation_changed' for '%s' with refresh_page=True", animation_name)
                 
-                print(f"✅ Successfully auto-triggered animation: {animation_name} ({media_type}) for scene: {scene_name}")
+                logger.info("✅ Successfully auto-triggered animation: %s (%s) for scene: %s", animation_name, media_type, scene_name)
             else:
-                print(f"❌ SocketIO not available for auto-trigger")
+                logger.error("❌ SocketIO not available for auto-trigger")
             
         except Exception as e:
-            print(f"❌ Error triggering animation: {e}")
+            logger.error("❌ Error triggering animation: %s", e)
     
     def stop_watching(self):
         """Stop watching the scene file"""
         self.running = False
-        if self.watch_thread and self.watch_thread.is_alive():
-            print("🛑 Stopping OBS Scene Watcher...")
-            self.watch_thread.join(timeout=2)
-        print("🛑 OBS Scene Watcher stopped")
+        if self.watch_task and not self.watch_task.done():
+            logger.info("🛑 Stopping OBS Scene Watcher...")
+            self.watch_task.cancel()
+        logger.info("🛑 OBS Scene Watcher stopped")
 
 
 class OBSWebSocketClient:
@@ -427,67 +716,75 @@ class OBSWebSocketClient:
         self.client = None
         self.connected = False
         self.settings = {}
+        self.settings_redacted_str = ''  # describe_obs_settings(self.settings), rebuilt only when settings change
         self.scene_mappings = []
         self.connection_thread = None
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 20  # Increased for better persistence
         self.auto_reconnect_enabled = True
-        self.connection_monitor_thread = None
+        self.connection_monitor_task = None
+        self._get_scene_name = SCENE_CHANGE_EVENTS[False][1]
+        self._current_scene_request, self._get_current_scene_name = CURRENT_SCENE_REQUESTS[False]
+        self._scene_list_fields = SCENE_LIST_FIELDS[False]
+        # (current scene, scene names, monotonic fetch time) from the last GetSceneList; scene change
+        # events keep the current scene fresh in between, so status polls don't need OBS I/O
+        self._scene_snapshot = None
+        self._reconnect_wake = asyncio.Event()  # Set by force_reconnect() to cut backoff waits short
+        self._reconnect_waiters = 0
+        self._monitor_wakeup = asyncio.Event()  # Set on connection state changes so the monitor reacts immediately
+        # Full-jitter exponential backoff between failed reconnects (spreads out clients after an OBS restart)
+        self._reconnect_attempt = 0
+        self._backoff_base = 1.0
+        self._backoff_cap = 60.0
+        # Scene storage writes are coalesced: only the newest pending scene name is kept for the writer thread
+        self._scene_write_queue = queue.Queue(maxsize=1)
+        self._scene_writer_thread = None
         self.should_be_connected = False  # Track intended connection state
         
     def load_settings(self):
         """Load OBS connection settings from config file"""
         try:
-            obs_config_path = DATA_DIR / 'config' / 'obs_settings.json'
-            print(f"📂 Looking for settings at: {obs_config_path}")
-            
-            if obs_config_path.exists():
-                print("✅ Settings file found, loading...")
-                with open(obs_config_path, 'r') as f:
-                    self.settings = json.load(f)
-                
-                # Log settings without password
-                settings_log = self.settings.copy()
-                if 'password' in settings_log and settings_log['password']:
-                    settings_log['password'] = '[REDACTED]'
-                else:
-                    settings_log['password'] = '[EMPTY]'
-                print(f"📋 Loaded settings: {settings_log}")
+            logger.debug("📂 Looking for settings at: %s", OBS_SETTINGS_FILE)
+            
+            settings = read_obs_settings()
+            if settings is not None:
+                logger.debug("✅ Settings file found, loading...")
+                # Unchanged settings (the common case on reconnects) keep the existing redacted summary
+                if settings != self.settings or not self.settings_redacted_str:
+                    self.settings_redacted_str = describe_obs_settings(settings)
+                    logger.info("📋 Loaded settings: %s", self.settings_redacted_str)
+                self.settings = settings
                 return True
             else:
-                print("❌ Settings file not found")
+                logger.warning("❌ Settings file not found")
                 return False
         except Exception as e:
-            print(f"❌ Error loading OBS settings: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error loading OBS settings: %s", e)
             return False
     
     def load_scene_mappings(self):
         """Load scene to animation mappings from config file"""
         try:
-            mappings_path = DATA_DIR / 'config' / 'obs_mappings.json'
-            if mappings_path.exists():
-                with open(mappings_path, 'r') as f:
-                    self.scene_mappings = json.load(f)
+            if OBS_MAPPINGS_FILE.exists():
+                self.scene_mappings = read_obs_mappings()
                 return True
             return False
         except Exception as e:
-            print(f"❌ Error loading OBS scene mappings: {e}")
+            logger.error("❌ Error loading OBS scene mappings: %s", e)
             return False
     
     def connect(self):
         """Establish connection to OBS WebSocket server"""
         if not self.load_settings():
-            print("⚠️  No OBS settings found, skipping connection")
+            logger.warning("⚠️  No OBS settings found, skipping connection")
             return False
             
         if not self.load_scene_mappings():
-            print("⚠️  No scene mappings found, OBS events will be ignored")
+            logger.warning("⚠️  No scene mappings found, OBS events will be ignored")
             self.scene_mappings = []
         
         try:
-            print(f"🔌 Attempting to connect to OBS at {self.settings.get('host', 'localhost')}:{self.settings.get('port', 4455)}")
+            logger.info("🔌 Attempting to connect to OBS at %s:%s", self.settings.get('host', 'localhost'), self.settings.get('port', 4455))
             
             # Create OBS WebSocket client
             self.client = obsws(
@@ -501,34 +798,23 @@ class OBSWebSocketClient:
             
             # Test the connection by getting version
             version_info = self.client.call(requests.GetVersion())
-            print(f"✅ Connected to OBS Studio {version_info.getObsVersion()}")
-            print(f"✅ OBS WebSocket version: {version_info.getObsWebSocketVersion()}")
+            logger.info("✅ Connected to OBS Studio %s (OBS WebSocket %s)",
+                        version_info.getObsVersion(), version_info.getObsWebSocketVersion())
             
             self.connected = True
             self.should_be_connected = True  # Mark that we want to stay connected
             self.reconnect_attempts = 0
+            self._reconnect_attempt = 0
             
-            # Register for scene change events
-            try:
-                # Try newer OBS WebSocket event first
-                if hasattr(events, 'CurrentProgramSceneChanged'):
-                    self.client.register(self._on_scene_changed, events.CurrentProgramSceneChanged)
-                    print("👂 Registered for CurrentProgramSceneChanged events")
-                elif hasattr(events, 'SwitchScenes'):
-                    self.client.register(self._on_scene_changed, events.SwitchScenes)
-                    print("👂 Registered for SwitchScenes events (fallback)")
-                else:
-                    print("⚠️ No suitable scene change event found")
-            except Exception as event_error:
-                print(f"⚠️ Error registering for scene events: {event_error}")
-                # Try fallback
-                try:
-                    self.client.register(self._on_scene_changed, events.SwitchScenes)
-                    print("👂 Fallback: Registered for SwitchScenes events")
-                except Exception as fallback_error:
-                    print(f"❌ Failed to register for any scene events: {fallback_error}")
+            # Register for scene change events (CurrentProgramSceneChanged, or SwitchScenes on legacy v4 servers)
+            scene_event, self._get_scene_name = SCENE_CHANGE_EVENTS[bool(self.client.legacy)]
+            self._current_scene_request, self._get_current_scene_name = CURRENT_SCENE_REQUESTS[bool(self.client.legacy)]
+            self._scene_list_fields = SCENE_LIST_FIELDS[bool(self.client.legacy)]
+            self._scene_snapshot = None
+            self.client.register(self._on_scene_changed, scene_event)
+            logger.debug("👂 Registered for %s events", scene_event.__name__)
             
-            print("👂 OBS event listener setup complete, waiting for scene changes...")
+            logger.info("👂 OBS event listener setup complete, waiting for scene changes...")
             
             # Start connection monitor for persistent connection
             self._start_connection_monitor()
@@ -536,74 +822,38 @@ class OBSWebSocketClient:
             return True
             
         except Exception as e:
-            print(f"❌ Failed to connect to OBS: {e}")
+            logger.error("❌ Failed to connect to OBS: %s", e)
             self.connected = False
             self._schedule_reconnect()
             return False
     
     def _on_scene_changed(self, message):
         """Handle OBS scene change events - BULLETPROOF VERSION"""
-        scene_name = None
-        event_time = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        
         try:
-            print(f"🎬 [{event_time}] Scene change event received, type: {type(message)}")
-            
-            # Handle different event formats with bulletproof extraction
-            try:
-                if hasattr(message, 'sceneName') and message.sceneName:
-                    scene_name = str(message.sceneName)
-                    print(f"🎬 Got scene name from .sceneName: {scene_name}")
-                elif hasattr(message, 'getSceneName') and callable(message.getSceneName):
-                    scene_name = str(message.getSceneName())
-                    print(f"🎬 Got scene name from .getSceneName(): {scene_name}")
-                elif hasattr(message, 'datain') and isinstance(message.datain, dict) and 'sceneName' in message.datain:
-                    scene_name = str(message.datain['sceneName'])
-                    print(f"🎬 Got scene name from datain: {scene_name}")
-                else:
-                    print(f"🎬 Could not extract scene name. Message attributes: {dir(message)}")
-                    if hasattr(message, '__dict__'):
-                        print(f"🎬 Message dict: {message.__dict__}")
-                    return
-            except Exception as extract_error:
-                print(f"❌ CRITICAL: Scene name extraction failed: {extract_error}")
-                return
-            
-            if not scene_name or not isinstance(scene_name, str) or len(scene_name.strip()) == 0:
-                print(f"❌ Invalid scene name extracted: '{scene_name}'")
-                return
-                
-            scene_name = scene_name.strip()
-            print(f"🎬 [{event_time}] INSTANT OBS Scene change detected: '{scene_name}'")
-            
-        except Exception as initial_error:
-            print(f"❌ CRITICAL: Initial scene change processing failed: {initial_error}")
-            print(f"❌ Message type: {type(message)}, Message: {message}")
+            scene_name = self._get_scene_name(message.datain).strip()
+        except (AttributeError, KeyError, TypeError) as extract_error:
+            # %r formatting is deferred, so the event repr is only built when the message is emitted
+            logger.warning("🎬 Could not extract scene name from %r: %s", message, extract_error)
+            return
+        
+        if not scene_name:
+            logger.error("❌ Invalid scene name extracted: '%s'", scene_name)
             return
         
+        logger.info("🎬 INSTANT OBS Scene change detected: '%s'", scene_name)
+        
+        snapshot = self._scene_snapshot
+        if snapshot is not None:
+            self._scene_snapshot = (scene_name, snapshot[1], snapshot[2])
+        
         # Process the scene change in separate try blocks to prevent cascading failures
         
-        # 1. Update scene data via API route (for file storage only)
+        # 1. Queue the scene for file storage (written by the scene writer thread)
         try:
-            import requests
-            import json
-            
-            # Get the current server port dynamically
-            current_port = get_current_port()
-            
-            # Use the existing API route to save scene data
-            response = requests.post(f'http://localhost:{current_port}/api/obs/current-scene', 
-                                   json={'current_scene': scene_name},
-                                   headers={'Content-Type': 'application/json'},
-                                   timeout=1)
-            
-            storage_time = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            if response.status_code == 200:
-                print(f"💾 [{storage_time}] INSTANT scene data saved: {scene_name}")
-            else:
-                print(f"⚠️ Scene data save failed (status {response.status_code}): {response.text}")
+            self._save_current_scene_to_storage(scene_name)
+            logger.debug("💾 INSTANT scene data queued for storage: %s", scene_name)
         except Exception as api_error:
-            print(f"⚠️ Scene data save failed (non-critical): {api_error}")
+            logger.warning("⚠️ Scene data save failed (non-critical): %s", api_error)
             # Don't return - continue with other operations
         
         # 2. Emit to frontend (independent operation)
@@ -616,90 +866,153 @@ class OBSWebSocketClient:
                     'timestamp': time.time(),
                     'event_time': emit_time
                 })
-                print(f"📡 [{emit_time}] INSTANT Socket.IO emission to frontend: {scene_name}")
+                logger.debug("📡 INSTANT Socket.IO emission to frontend: %s", scene_name)
             else:
-                print("⚠️ SocketIO not available for scene change notification")
+                logger.warning("⚠️ SocketIO not available for scene change notification")
         except Exception as emit_error:
-            print(f"⚠️ Socket.IO emission failed (non-critical): {emit_error}")
+            logger.warning("⚠️ Socket.IO emission failed (non-critical): %s", emit_error)
             # Don't return - continue with other operations
         
         # Note: Animation triggering is now handled by OBSSceneWatcher file watcher
         # This prevents duplicate triggers and provides better separation of concerns
         
-        print(f"✅ [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Scene change processing completed successfully")
+        logger.debug("✅ Scene change processing completed successfully")
     
     def _schedule_reconnect(self):
         """Schedule a reconnection attempt"""
         if self.reconnect_attempts < self.max_reconnect_attempts:
             self.reconnect_attempts += 1
-            delay = min(30, 2 ** self.reconnect_attempts)  # Exponential backoff, max 30 seconds
-            print(f"⏰ Scheduling OBS reconnection attempt {self.reconnect_attempts}/{self.max_reconnect_attempts} in {delay} seconds")
+            delay = self._backoff_delay(self.reconnect_attempts)
+            logger.info("⏰ Scheduling OBS reconnection attempt %d/%d in %.1f seconds", self.reconnect_attempts, self.max_reconnect_attempts, delay)
             
-            def reconnect_after_delay():
-                time.sleep(delay)
+            async def reconnect_after_delay():
+                if await self._wait_for_reconnect_wake(delay):
+                    logger.info("⚡ Reconnect delay cut short by manual reconnect request")
                 if not self.connected:  # Only reconnect if still disconnected
-                    print(f"🔄 Attempting OBS reconnection ({self.reconnect_attempts}/{self.max_reconnect_attempts})")
-                    self.connect()
+                    logger.info("🔄 Attempting OBS reconnection (%d/%d)", self.reconnect_attempts, self.max_reconnect_attempts)
+                    await asyncio.to_thread(self.connect)
             
-            Thread(target=reconnect_after_delay, daemon=True).start()
+            run_in_background(reconnect_after_delay())
         else:
-            print(f"❌ Max OBS reconnection attempts ({self.max_reconnect_attempts}) reached. Will retry later...")
+            logger.warning("❌ Max OBS reconnection attempts (%d) reached. Will retry later...", self.max_reconnect_attempts)
             # Reset attempts after a longer delay to try again
-            def reset_attempts_later():
-                time.sleep(300)  # Wait 5 minutes before allowing retries again
+            async def reset_attempts_later():
+                await self._wait_for_reconnect_wake(300)  # Wait 5 minutes before allowing retries again
                 self.reconnect_attempts = 0
                 if self.should_be_connected and not self.connected:
-                    print("🔄 Retrying OBS connection after cooldown period...")
+                    logger.info("🔄 Retrying OBS connection after cooldown period...")
                     self._schedule_reconnect()
-            Thread(target=reset_attempts_later, daemon=True).start()
+            run_in_background(reset_attempts_later())
+    
+    async def _wait_for_reconnect_wake(self, delay):
+        """Wait up to delay seconds on the background loop, returning True if force_reconnect() woke us early"""
+        self._reconnect_waiters += 1
+        try:
+            await asyncio.wait_for(self._reconnect_wake.wait(), delay)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._reconnect_waiters -= 1
+            if not self._reconnect_waiters:
+                self._reconnect_wake.clear()
+    
+    def force_reconnect(self):
+        """Reconnect now instead of waiting out the current backoff delay
+        
+        Returns:
+            bool: False if already connected, True if a reconnect was triggered.
+        """
+        self.should_be_connected = True
+        self.auto_reconnect_enabled = True
+        self.reconnect_attempts = 0
+        if self.connected:
+            return False
+        
+        def wake():
+            # Wake pending backoff waits, or connect directly if nothing is scheduled
+            if self._reconnect_waiters:
+                self._reconnect_wake.set()
+            else:
+                asyncio.ensure_future(asyncio.to_thread(self.connect))
+        
+        get_background_loop().call_soon_threadsafe(wake)
+        logger.info("⚡ Manual OBS reconnect requested")
+        return True
+    
+    def _wake_monitor(self):
+        """Wake the connection monitor so it re-checks the connection state now (callable from any thread)"""
+        get_background_loop().call_soon_threadsafe(self._monitor_wakeup.set)
+    
+    def _backoff_delay(self, attempt):
+        """Full-jitter backoff: a random delay between 0 and the capped exponential bound"""
+        return random.uniform(0, min(self._backoff_cap, self._backoff_base * (2 ** attempt)))
     
     def _start_connection_monitor(self):
-        """Start a background thread to monitor and maintain OBS connection"""
-        if self.connection_monitor_thread and self.connection_monitor_thread.is_alive():
+        """Start a background task to monitor and maintain OBS connection"""
+        if self.connection_monitor_task and not self.connection_monitor_task.done():
+            return
+        
+        # Nothing to monitor while OBS is disabled - enabling it in settings starts the monitor
+        if not self.settings or not self.settings.get('enabled', True):
+            logger.debug("👀 OBS disabled or not configured, connection monitor not started")
             return
             
-        def connection_monitor():
-            print("👀 Starting OBS connection monitor with PERSISTENT RECONNECTION...")
+        async def connection_monitor():
+            logger.info("👀 Starting OBS connection monitor with PERSISTENT RECONNECTION...")
             monitor_loop_count = 0
+            delay = 10  # Check every 10 seconds while healthy, back off after failed reconnects
             while self.auto_reconnect_enabled:
                 try:
-                    time.sleep(10)  # Check every 10 seconds
+                    # Sleep until the delay elapses or a state change wakes us
+                    try:
+                        await asyncio.wait_for(self._monitor_wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._monitor_wakeup.clear()
+                    if not self.auto_reconnect_enabled:
+                        break
+                    delay = 10
                     monitor_loop_count += 1
                     
                     # Debug logging every few loops
                     if monitor_loop_count % 6 == 0:  # Every minute
-                        print(f"👀 Connection monitor status: should_connect={self.should_be_connected}, connected={self.connected}, auto_reconnect={self.auto_reconnect_enabled}")
+                        logger.debug("👀 Connection monitor status: should_connect=%s, connected=%s, auto_reconnect=%s", self.should_be_connected, self.connected, self.auto_reconnect_enabled)
                     
                     if self.should_be_connected and not self.connected:
-                        print("🔄 Connection monitor: OBS DISCONNECTED - FORCING RECONNECT...")
-                        success = self.connect()
+                        logger.warning("🔄 Connection monitor: OBS DISCONNECTED - FORCING RECONNECT...")
+                        success = await asyncio.to_thread(self.connect)
                         if success:
-                            print("✅ Connection monitor: RECONNECTION SUCCESSFUL")
+                            self._reconnect_attempt = 0
+                            logger.info("✅ Connection monitor: RECONNECTION SUCCESSFUL")
                         else:
-                            print("❌ Connection monitor: Reconnection failed, will retry in 10 seconds")
+                            self._reconnect_attempt += 1
+                            delay = self._backoff_delay(self._reconnect_attempt)
+                            logger.warning("❌ Connection monitor: Reconnection failed, will retry in %.1f seconds", delay)
                     elif self.connected and self.client:
                         # Test connection with a simple request
                         try:
-                            self.client.call(requests.GetVersion())
+                            await asyncio.to_thread(self.client.call, requests.GetVersion())
                             # Connection is healthy - no logging needed
                         except Exception as e:
-                            print(f"🔄 Connection monitor: OBS connection test FAILED: {e}")
-                            print("🔄 Marking as disconnected and forcing reconnect...")
+                            logger.warning("🔄 Connection monitor: OBS connection test FAILED: %s - forcing reconnect", e)
                             self.connected = False
                             if self.should_be_connected:
-                                success = self.connect()
+                                success = await asyncio.to_thread(self.connect)
                                 if success:
-                                    print("✅ Connection monitor: RECONNECTION after test failure SUCCESSFUL")
+                                    self._reconnect_attempt = 0
+                                    logger.info("✅ Connection monitor: RECONNECTION after test failure SUCCESSFUL")
                                 else:
-                                    print("❌ Connection monitor: Reconnection after test failure FAILED")
+                                    self._reconnect_attempt += 1
+                                    delay = self._backoff_delay(self._reconnect_attempt)
+                                    logger.warning("❌ Connection monitor: Reconnection after test failure FAILED, will retry in %.1f seconds", delay)
                                 
                 except Exception as e:
-                    print(f"❌ CRITICAL: Connection monitor error: {e}")
-                    print("🔄 Connection monitor continuing despite error...")
-                    time.sleep(30)  # Wait longer on monitor errors
+                    logger.critical("❌ CRITICAL: Connection monitor error: %s - continuing despite error", e)
+                    self._reconnect_attempt += 1
+                    delay = self._backoff_delay(self._reconnect_attempt)  # Back off on monitor errors
                     
-        self.connection_monitor_thread = Thread(target=connection_monitor, daemon=True)
-        self.connection_monitor_thread.start()
+        self.connection_monitor_task = run_in_background(connection_monitor())
     
     def disconnect(self, permanent=False, force=False):
         """Disconnect from OBS WebSocket server
@@ -709,48 +1022,46 @@ class OBSWebSocketClient:
             force (bool): If True, bypasses settings check for permanent disconnection.
         """
         self.connected = False
+        self._scene_snapshot = None
         
-        if permanent and not force:
+        if permanent:
             # Check if OBS is enabled in settings before allowing permanent disconnect
             try:
-                obs_config_path = DATA_DIR / 'config' / 'obs_settings.json'
-                if obs_config_path.exists():
-                    with open(obs_config_path, 'r') as f:
-                        settings = json.load(f)
-                    
+                settings = read_obs_settings() if not force else None
+                if settings is not None:
                     if settings.get('enabled', True):
-                        print("🚨 REFUSING permanent disconnect - OBS is enabled in settings!")
-                        print("🔄 Keeping auto-reconnection active per user settings")
+                        logger.warning("🚨 REFUSING permanent disconnect - OBS is enabled in settings, keeping auto-reconnection active")
                         # Don't disable auto-reconnection if settings say to stay connected
                         return
                         
             except Exception as settings_error:
-                print(f"⚠️ Could not check settings for disconnect: {settings_error}")
                 # If we can't check settings, be safe and keep connection active
-                print("🚨 Refusing permanent disconnect due to settings check failure")
+                logger.warning("🚨 Refusing permanent disconnect, could not check settings: %s", settings_error)
                 return
             
             self.should_be_connected = False  # Disable auto-reconnection
             self.auto_reconnect_enabled = False
-            print("🔌 Permanently disconnecting from OBS WebSocket server")
+            logger.info("🔌 Permanently disconnecting from OBS WebSocket server")
         else:
-            print("🔌 Temporarily disconnecting from OBS WebSocket server")
+            logger.info("🔌 Temporarily disconnecting from OBS WebSocket server")
             
         if self.client:
             try:
                 self.client.disconnect()
-                print("✅ Disconnected from OBS WebSocket server")
+                logger.info("✅ Disconnected from OBS WebSocket server")
             except Exception as e:
-                print(f"⚠️  Error during OBS disconnect: {e}")
+                logger.warning("⚠️  Error during OBS disconnect: %s", e)
             finally:
                 self.client = None
+        
+        self._wake_monitor()
     
     def test_connection(self):
         """Test OBS WebSocket connection without establishing persistent connection"""
-        print("📋 test_connection() called")
+        logger.debug("📋 test_connection() called")
         
         if not self.load_settings():
-            print("❌ No settings found")
+            logger.warning("❌ No settings found")
             return False, "No OBS settings configured"
         
         # Log connection attempt details (without password)
@@ -759,61 +1070,60 @@ class OBSWebSocketClient:
             'port': self.settings.get('port', 4455),
             'password_set': bool(self.settings.get('password', ''))
         }
-        print(f"🔌 Attempting connection to: {connection_info}")
+        logger.info("🔌 Attempting connection to: %s", connection_info)
         
         try:
-            import time
             start_time = time.time()
             
-            print("📱 Creating obsws client...")
+            logger.debug("📱 Creating obsws client...")
             # Create temporary client for testing
             test_client = obsws(
                 host=self.settings.get('host', 'localhost'),
                 port=self.settings.get('port', 4455),
                 password=self.settings.get('password', '')
             )
-            print("✅ obsws client created successfully")
+            logger.debug("✅ obsws client created successfully")
             
             # Test the connection
-            print("🔗 Calling connect()...")
+            logger.debug("🔗 Calling connect()...")
             test_client.connect()
             connect_time = time.time() - start_time
-            print(f"✅ Connected successfully in {connect_time:.2f}s")
+            logger.info("✅ Connected successfully in %.2fs", connect_time)
             
-            print("📞 Calling GetVersion()...")
+            logger.debug("📞 Calling GetVersion()...")
             version_start = time.time()
             version_info = test_client.call(requests.GetVersion())
             version_time = time.time() - version_start
-            print(f"✅ GetVersion completed in {version_time:.2f}s")
+            logger.debug("✅ GetVersion completed in %.2fs", version_time)
             
-            print("🔌 Disconnecting...")
+            logger.debug("🔌 Disconnecting...")
             test_client.disconnect()
             
             total_time = time.time() - start_time
             obs_version = version_info.getObsVersion()
             success_msg = f"Connected to OBS Studio {obs_version} (total: {total_time:.2f}s)"
-            print(f"🎉 {success_msg}")
+            logger.info("🎉 %s", success_msg)
             
             return True, success_msg
             
         except Exception as e:
             total_time = time.time() - start_time if 'start_time' in locals() else 0
             error_msg = f"Connection failed: {str(e)}"
-            print(f"❌ {error_msg} (after {total_time:.2f}s)")
+            logger.error("❌ %s (after %.2fs)", error_msg, total_time)
             
             # Add more specific error information
             if "10060" in str(e):
-                print("🔍 Error 10060 = Connection timeout (target not responding)")
-                print("💡 Possible causes:")
-                print("   - OBS Studio not running")
-                print("   - OBS WebSocket server not enabled")
-                print("   - Wrong host/port")
-                print("   - Firewall blocking connection")
+                logger.info("🔍 Error 10060 = Connection timeout (target not responding)")
+                logger.info("💡 Possible causes:")
+                logger.info("   - OBS Studio not running")
+                logger.info("   - OBS WebSocket server not enabled")
+                logger.info("   - Wrong host/port")
+                logger.info("   - Firewall blocking connection")
             elif "10061" in str(e):
-                print("🔍 Error 10061 = Connection actively refused")
-                print("💡 Possible causes:")
-                print("   - OBS WebSocket server disabled")
-                print("   - Wrong port number")
+                logger.info("🔍 Error 10061 = Connection actively refused")
+                logger.info("💡 Possible causes:")
+                logger.info("   - OBS WebSocket server disabled")
+                logger.info("   - Wrong port number")
             
             return False, error_msg
     
@@ -823,41 +1133,12 @@ class OBSWebSocketClient:
             return None
         
         try:
-            # Try the newer OBS WebSocket API first
-            current_scene = self.client.call(requests.GetCurrentProgramScene())
-            print(f"📊 GetCurrentProgramScene response: {current_scene}")
-            
-            # Handle different response formats
-            if hasattr(current_scene, 'sceneName'):
-                return current_scene.sceneName
-            elif hasattr(current_scene, 'getName'):
-                return current_scene.getName()
-            elif isinstance(current_scene, dict) and 'sceneName' in current_scene:
-                return current_scene['sceneName']
-            else:
-                print(f"📊 Unexpected current scene response format: {type(current_scene)}, {current_scene}")
-                return None
-                
+            current_scene = self.client.call(self._current_scene_request())
+            logger.debug("📊 %s response: %s", current_scene.name, current_scene)
+            return self._get_current_scene_name(current_scene.datain)
         except Exception as e:
-            print(f"❌ GetCurrentProgramScene failed: {e}")
-            # Fallback to older API
-            try:
-                current_scene = self.client.call(requests.GetCurrentScene())
-                print(f"📊 GetCurrentScene (fallback) response: {current_scene}")
-                
-                if hasattr(current_scene, 'getName'):
-                    return current_scene.getName()
-                elif hasattr(current_scene, 'sceneName'):
-                    return current_scene.sceneName
-                elif isinstance(current_scene, dict) and 'sceneName' in current_scene:
-                    return current_scene['sceneName']
-                else:
-                    print(f"📊 Unexpected fallback scene response format: {type(current_scene)}, {current_scene}")
-                    return None
-                    
-            except Exception as fallback_error:
-                print(f"❌ Error getting current OBS scene (both methods failed): {fallback_error}")
-                return None
+            logger.error("❌ Error getting current OBS scene: %s", e)
+            return None
     
     def get_scene_list(self):
         """Get list of all scenes from OBS"""
@@ -865,181 +1146,536 @@ class OBSWebSocketClient:
             return []
         
         try:
-            scene_list = self.client.call(requests.GetSceneList())
-            return [scene['sceneName'] for scene in scene_list.getScenes()]
+            return self.get_scene_overview()[1]
         except Exception as e:
-            print(f"❌ Error getting OBS scene list: {e}")
+            logger.error("❌ Error getting OBS scene list: %s", e)
             return []
     
+    def get_scene_overview(self):
+        """Get (current scene, scene names) from a single GetSceneList round-trip
+        
+        Unlike get_current_scene/get_scene_list this raises when the call fails, so it doubles
+        as a connection health check.
+        """
+        if not self.connected or not self.client:
+            return None, []
+        
+        response = self.client.call(requests.GetSceneList())
+        if not response.status:
+            raise RuntimeError(f"GetSceneList failed: {response.datain}")
+        current_key, name_key = self._scene_list_fields
+        current_scene = response.datain.get(current_key)
+        scene_list = [scene[name_key] for scene in response.datain.get('scenes', [])]
+        self._scene_snapshot = (current_scene, scene_list, time.monotonic())
+        return current_scene, scene_list
+    
+    def get_cached_scene_overview(self, max_age=SCENE_SNAPSHOT_MAX_AGE):
+        """Get (current scene, scene names), reusing the last GetSceneList result for up to max_age seconds
+        
+        Connection health is covered by the connection monitor's periodic GetVersion check.
+        """
+        snapshot = self._scene_snapshot
+        if self.connected and snapshot is not None and time.monotonic() - snapshot[2] < max_age:
+            return snapshot[0], list(snapshot[1])
+        return self.get_scene_overview()
+    
     def _save_current_scene_to_storage(self, scene_name):
-        """Save current scene to persistent storage file - MINIMAL VERSION (current scene only)"""
+        """Queue the current scene for the writer thread; rapid scene flips collapse into one write"""
         if not scene_name or not isinstance(scene_name, str):
             raise ValueError(f"Invalid scene name for storage: {scene_name}")
-            
+        
+        if self._scene_writer_thread is None or not self._scene_writer_thread.is_alive():
+            self._scene_writer_thread = threading.Thread(target=self._scene_writer_loop, daemon=True)
+            self._scene_writer_thread.start()
+        
+        while True:
+            try:
+                self._scene_write_queue.put_nowait(scene_name)
+                return
+            except queue.Full:
+                # Drop the stale pending scene - only the latest one matters
+                try:
+                    self._scene_write_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _scene_writer_loop(self):
+        """Drain the scene write queue, persisting each scene name in turn"""
+        while True:
+            scene_name = self._scene_write_queue.get()
+            try:
+                self._write_current_scene_to_storage(scene_name)
+            except Exception:
+                # Already reported by _write_current_scene_to_storage; keep the writer alive
+                pass
+    
+    def _write_current_scene_to_storage(self, scene_name):
+        """Save current scene to persistent storage file - MINIMAL VERSION (current scene only)"""
         try:
             # Ensure scene name is clean
             scene_name = str(scene_name).strip()
             if not scene_name:
                 raise ValueError("Scene name is empty after cleaning")
             
-            current_scene_path = DATA_DIR / 'config' / 'obs_current_scene.json'
-            
-            # Simple data structure - only current scene and timestamp
-            scene_data = {
-                'current_scene': None,
-                'last_updated': None
-            }
-            
-            if current_scene_path.exists():
-                try:
-                    with open(current_scene_path, 'r', encoding='utf-8') as f:
-                        loaded_data = json.load(f)
-                        if isinstance(loaded_data, dict):
-                            # Only preserve current_scene and last_updated, ignore scene_list
-                            scene_data['current_scene'] = loaded_data.get('current_scene')
-                            scene_data['last_updated'] = loaded_data.get('last_updated')
-                        else:
-                            print("⚠️ Invalid JSON structure in storage file, using defaults")
-                except (json.JSONDecodeError, UnicodeDecodeError) as parse_error:
-                    print(f"⚠️ Could not parse existing storage file: {parse_error}")
-                    # Use default scene_data structure
-                except Exception as file_error:
-                    print(f"⚠️ Could not read existing storage file: {file_error}")
-                    # Use default scene_data structure
-            
-            # Update current scene and timestamp only
-            scene_data['current_scene'] = scene_name
-            scene_data['last_updated'] = datetime.now().isoformat()
-            
-            # Ensure config directory exists
-            try:
-                config_dir = DATA_DIR / 'config'
-                config_dir.mkdir(parents=True, exist_ok=True)
-            except Exception as dir_error:
-                print(f"❌ Could not create config directory: {dir_error}")
-                raise
-            
-            # Save updated data with atomic write
-            try:
-                temp_path = current_scene_path.with_suffix('.tmp')
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(scene_data, f, indent=2, ensure_ascii=False)
-                
-                # Atomic rename to prevent corruption
-                temp_path.replace(current_scene_path)
-                
-            except Exception as write_error:
-                print(f"❌ Could not write to storage file: {write_error}")
-                # Clean up temp file if it exists
-                try:
-                    if temp_path.exists():
-                        temp_path.unlink()
-                except:
-                    pass
-                raise
+            write_current_scene(scene_name)
                 
         except Exception as e:
-            print(f"❌ CRITICAL: Storage save operation failed: {e}")
+            logger.error("❌ CRITICAL: Storage save operation failed: %s", e)
             raise  # Re-raise so caller can handle
     
-
-    
     def enable_persistent_connection(self):
         """Enable persistent auto-reconnection to OBS"""
-        print("🔄 Enabling persistent OBS connection...")
+        # Fast path: already connected with persistence on and the monitor running - nothing to change
+        if (self.connected and self.auto_reconnect_enabled and self.should_be_connected
+                and self.connection_monitor_task and not self.connection_monitor_task.done()):
+            return True
+        
+        logger.info("🔄 Enabling persistent OBS connection...")
         self.auto_reconnect_enabled = True
         self.should_be_connected = True
         
+        # Refresh settings (cached until the file changes) so a just-enabled toggle is seen
+        if not self.load_settings():
+            logger.error("❌ No OBS settings available for persistent connection")
+            return False
+        
         # If not connected, try to connect
         if not self.connected:
-            if not self.settings:  # Only load settings if not already loaded
-                if not self.load_settings():
-                    print("❌ No OBS settings available for persistent connection")
-                    return False
-            
-            print("🔌 Attempting OBS connection for persistent mode...")
+            logger.info("🔌 Attempting OBS connection for persistent mode...")
             success = self.connect()
             if not success:
-                print("⚠️  Initial connection failed, but will keep trying...")
+                logger.warning("⚠️  Initial connection failed, but will keep trying...")
         
-        # Start connection monitor if not already running
+        # Start connection monitor if not already running, and let a running one re-check right away
         self._start_connection_monitor()
+        self._wake_monitor()
         return self.connected
 
 
+def _json_loads(data):
+    """Parse JSON from bytes or str (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent=2):
+    """Serialize to UTF-8 JSON bytes (orjson only supports 2-space indentation)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if not indent:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def _json_text(obj):
+    """Compact JSON as str, for WebSocket text frames"""
+    return _json_dumps(obj, indent=None).decode('utf-8')
+
+
+def _read_json_file(path):
+    """Read and parse a JSON file as bytes, skipping the text decode step"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+# Parsed JSON files keyed by path -> ((st_mtime_ns, st_ino, st_size), data)
+_json_file_cache = {}
+
+
+def _json_cache_key(st):
+    """Identity of a file version for _json_file_cache (changes on every rewrite/replace)"""
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+
+def _read_json_cached(path):
+    """Parse a JSON file, reusing the last result while the file is unchanged (raises FileNotFoundError/JSONDecodeError)
+    
+    Returns a shallow copy so callers can modify it without touching the cache.
+    """
+    path = str(path)
+    st = os.stat(path)
+    if not st.st_size:
+        # An empty file is never valid JSON; fail without opening it (callers treat it as malformed)
+        raise json.JSONDecodeError("Empty JSON file", "", 0)
+    key = _json_cache_key(st)
+    cached = _json_file_cache.get(path)
+    if cached is None or cached[0] != key:
+        cached = (key, _read_json_file(path))
+        _json_file_cache[path] = cached
+    return cached[1].copy()
+
+
+def read_obs_settings():
+    """Return the OBS settings dict, or None if obs_settings.json does not exist"""
+    try:
+        return _read_json_cached(OBS_SETTINGS_FILE)
+    except FileNotFoundError:
+        return None
+
+
+def describe_obs_settings(settings):
+    """One-line summary of OBS settings for logs, with the password redacted"""
+    return (f"host={settings.get('host')} port={settings.get('port')} enabled={settings.get('enabled', True)} "
+            f"password={'[REDACTED]' if settings.get('password') else '[EMPTY]'}")
+
+
+# Serializes JSON file writes: writers to one file share its fixed .tmp path, so concurrent writers
+# (e.g. the current-scene POST and the OBS client's scene writer thread, or two users.json saves) would
+# truncate each other's temp file. Reentrant so _write_json_cached can also cover its cache seed.
+_json_write_lock = threading.RLock()
+
+
+def _write_json_cached(path, data, indent=2):
+    """Atomically write a flat JSON dict/list and seed _read_json_cached with it, so the next read skips the parse"""
+    with _json_write_lock:
+        _atomic_write_json(path, data, indent)
+        _json_file_cache[str(path)] = (_json_cache_key(os.stat(path)), data.copy())
+
+
+def write_obs_settings(settings):
+    """Save the OBS settings"""
+    _write_json_cached(OBS_SETTINGS_FILE, settings)
+
+
+# Keys every scene mapping must carry (checked as one keys-view comparison per mapping)
+OBS_MAPPING_REQUIRED_KEYS = frozenset(('sceneName', 'animation'))
+
+
+def read_obs_mappings(path=OBS_MAPPINGS_FILE):
+    """Return the scene -> animation mapping list ([] if the file is missing, empty or malformed)"""
+    try:
+        data = _read_json_cached(path)
+    except (FileNotFoundError, ValueError):
+        return []
+    # Handle both formats: direct array or wrapped in 'mappings' key
+    if isinstance(data, dict):
+        data = data.get('mappings', [])
+    return data if isinstance(data, list) else []
+
+
+def write_obs_mappings(mappings):
+    """Save the scene -> animation mapping list"""
+    _write_json_cached(OBS_MAPPINGS_FILE, mappings)
+
+
+def read_current_scene_data():
+    """Return the stored {'current_scene', 'last_updated'} (both None until a scene has been stored)"""
+    try:
+        data = _read_json_cached(OBS_CURRENT_SCENE_FILE)
+    except (FileNotFoundError, ValueError):
+        data = {}
+    # Only current_scene and last_updated are kept; older files may also carry a scene_list
+    return {'current_scene': data.get('current_scene'), 'last_updated': data.get('last_updated')}
+
+
+def write_current_scene(scene_name):
+    """Store the current scene with a fresh timestamp and return the stored data
+    
+    No read-modify-write: the file only ever holds these two fields. OBSSceneWatcher picks
+    the change up from the file's mtime.
+    """
+    scene_data = {'current_scene': scene_name, 'last_updated': datetime.now().isoformat()}
+    # Machine-written and machine-read only, so skip the indentation
+    _write_json_cached(OBS_CURRENT_SCENE_FILE, scene_data, indent=None)
+    return scene_data
+
+
 def load_state():
-    """Load the current state from state.json"""
+    """Load the current state from state.json (served from the JSON cache while the file is unchanged)
+    
+    Each call still costs one stat, so writes from another process (e.g. the watchers in the
+    dev server's reloader parent) are picked up on the next request.
+    """
     try:
-        with open(STATE_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return _read_json_cached(STATE_FILE)
+    except (FileNotFoundError, ValueError):
         # Default state if file doesn't exist or is invalid
         default_state = {"current_animation": "anim1.html"}
         save_state(default_state)
         return default_state
 
 
+def _write_all(fd, payload):
+    """os.write() until every byte is on disk (a single call may write less, e.g. on a nearly full disk)"""
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _atomic_write_json(path, data, indent=2):
+    """Write JSON to a temp file and swap it into place so readers never see a partial file"""
+    path = Path(path)
+    payload = _json_dumps(data, indent)
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    with _json_write_lock:
+        try:
+            # Serialize first, then unbuffered writes of the whole payload keep the temp file's lifetime short
+            try:
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            except FileNotFoundError:
+                # Parent directory missing (first write or data dir wiped) - create it once and retry
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                _write_all(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(temp_path, path)
+            _json_file_cache.pop(str(path), None)
+        except Exception:
+            # Clean up the temp file so a failed write leaves the original untouched
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            raise
+
+
+def _create_json_file(path, build_data):
+    """Create a JSON file only if it does not exist yet; returns True if it was created
+    
+    The exclusive open doubles as the existence check (no separate stat, no race between two
+    starters), and build_data() is only called once the file has been claimed.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        try:
+            _write_all(fd, _json_dumps(build_data()))
+        finally:
+            os.close(fd)
+    except Exception:
+        # Don't leave an empty or partial file behind that would block the next attempt
+        Path(path).unlink(missing_ok=True)
+        raise
+    return True
+
+
 def save_state(state):
-    """Save the current state to state.json"""
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=4)
+    """Save the current state to state.json, seeding the JSON cache so the next load skips the parse"""
+    _write_json_cached(STATE_FILE, state, indent=4)
+    _connect_status_cache['checked_at'] = 0.0
 
 
 def ensure_state_file():
-    """Initialize state file if it doesn't exist"""
-    if not STATE_FILE.exists():
-        save_state({"current_animation": "anim1.html"})
+    """Load the state at startup, creating state.json if it doesn't exist"""
+    load_state()
+
+
+# Directory listings keyed by (directory, extensions) -> (directory st_mtime_ns, sorted names)
+_media_dir_cache = {}
+_media_inventory_cache = {'animations': None, 'videos': None, 'all_media': ()}
+
+
+def _cached_dir_listing(directory, extensions):
+    """Sorted tuple of file names in a directory matching the extension tuple
+    
+    The listing is cached against the directory's mtime (which changes whenever a file is
+    added, removed or renamed), so an unchanged directory costs a single stat and returns
+    the same tuple object.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+        cached = _media_dir_cache.get((directory, extensions))
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with os.scandir(directory) as entries:
+            names = tuple(sorted(entry.name for entry in entries
+                                 if entry.name.lower().endswith(extensions) and entry.is_file()))
+    except FileNotFoundError:
+        return ()
+    _media_dir_cache[(directory, extensions)] = (mtime, names)
+    return names
+
+
+def _iter_file_mtimes(directory, extensions):
+    """Yield (name, mtime) for files in a directory matching the extension tuple (uncached)"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(extensions) and entry.is_file():
+                    yield entry.name, entry.stat().st_mtime
+    except FileNotFoundError:
+        return
+
+
+def _scan_media_dir(directory, extensions):
+    """List file names in a directory matching the extension tuple (cached, see _cached_dir_listing)"""
+    return list(_cached_dir_listing(directory, extensions))
 
 
 def get_animation_files():
     """Get list of all animation HTML files"""
-    if not ANIMATIONS_DIR.exists():
-        return []
-    return sorted([f.name for f in ANIMATIONS_DIR.glob("*.html")])
+    return _scan_media_dir(ANIMATIONS_DIR_STR, HTML_EXT_TUPLE)
 
 
 def get_video_files():
     """Get list of all video files"""
-    if not VIDEOS_DIR.exists():
-        return []
-    video_files = []
-    for ext in VIDEO_EXTENSIONS:
-        video_files.extend(VIDEOS_DIR.glob(f"*{ext}"))
-    return sorted([f.name for f in video_files])
+    return _scan_media_dir(VIDEOS_DIR_STR, VIDEO_EXT_TUPLE)
+
+
+def get_media_inventory():
+    """Get (animations, videos, all_media) from a single listing of each media directory
+    
+    The merged list is only re-sorted when one of the directory listings has changed.
+    """
+    animations = _cached_dir_listing(ANIMATIONS_DIR_STR, HTML_EXT_TUPLE)
+    videos = _cached_dir_listing(VIDEOS_DIR_STR, VIDEO_EXT_TUPLE)
+    cache = _media_inventory_cache
+    if cache['animations'] is not animations or cache['videos'] is not videos:
+        cache['all_media'] = tuple(sorted(animations + videos))
+        cache['animations'] = animations
+        cache['videos'] = videos
+    return list(animations), list(videos), list(cache['all_media'])
+
+
+def _file_size_and_version(path):
+    """(size in bytes, mtime in ns) from one stat call, or (0, 0) if the file has gone away"""
+    try:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+    except OSError:
+        return 0, 0
+
+
+def _media_file_entry(filename, media_type, directory, url_prefix):
+    """One file list entry; the thumbnail URL carries the source mtime so it changes on re-upload"""
+    size, version = _file_size_and_version(os.path.join(directory, filename))
+    return {
+        'name': filename,
+        'type': media_type,
+        'size': size,
+        'url': f'{url_prefix}/{filename}',
+        'thumbnail': f'/admin/api/thumbnail/{filename}?v={version}'
+    }
+
+
+def list_media_file_entries():
+    """File list entries (name, type, size, url, thumbnail) for all animations and videos"""
+    animations, videos, _ = get_media_inventory()
+    files = [_media_file_entry(filename, 'animation', ANIMATIONS_DIR_STR, '/animations')
+             for filename in animations]
+    files.extend(_media_file_entry(filename, 'video', VIDEOS_DIR_STR, '/videos')
+                 for filename in videos)
+    return files
 
 
 def get_all_media_files():
     """Get list of all supported media files (HTML animations + videos)"""
-    animations = get_animation_files()
-    videos = get_video_files()
-    return sorted(animations + videos)
+    return get_media_inventory()[2]
 
 
 def is_video_file(filename):
     """Check if a filename has a video extension"""
-    return Path(filename).suffix.lower() in VIDEO_EXTENSIONS
+    return filename.lower().endswith(VIDEO_EXT_TUPLE)
 
 
 def is_html_file(filename):
     """Check if a filename has an HTML extension"""
-    return Path(filename).suffix.lower() in HTML_EXTENSIONS
+    return filename.lower().endswith(HTML_EXT_TUPLE)
+
+
+# A single path component: no separators or NUL, and no leading dot (rules out '.', '..' and hidden files)
+_SAFE_MEDIA_NAME_RE = re.compile(r'^(?!\.)[^/\\\x00]{1,255}$')
+
+
+def is_safe_media_name(filename):
+    """Check a client-supplied media file name before it is joined onto a media directory"""
+    return _SAFE_MEDIA_NAME_RE.match(filename) is not None
+
+
+# Filename -> (path, media type) for every file in the media directories, rebuilt whenever one of
+# the cached directory listings changes (see _cached_dir_listing); uploads/deletes invalidate it directly.
+_media_lookup_cache = {'key': None, 'lookup': {}}
+# How long a burst of connecting clients share one status payload
+MEDIA_RECHECK_INTERVAL = 1.0
+_media_generation = 0  # Bumped on every upload/delete (see _thumbnail_listing_etag)
+# 'status' payload sent to each connecting client; shared by a burst of reconnects
+_connect_status_cache = {'checked_at': 0.0, 'payload': None}
+
+
+def invalidate_media_cache():
+    """Force the next find_media_file() call to re-check the media directories"""
+    global _media_generation
+    _media_generation += 1
+    # Drop the listings too: on coarse-mtime filesystems (FAT/exFAT SD cards) an upload or delete
+    # within the same timestamp tick would not change the directory mtime
+    _media_dir_cache.clear()
+    # Clearing the key forces a lookup rebuild even when the directory mtimes look unchanged
+    _media_lookup_cache['key'] = None
+    _connect_status_cache['checked_at'] = 0.0
+
+
+def get_connect_status_payload():
+    """Return the connect-time status payload, rebuilt after state/media changes or every MEDIA_RECHECK_INTERVAL"""
+    cache = _connect_status_cache
+    now = time.monotonic()
+    if cache['payload'] is None or now - cache['checked_at'] >= MEDIA_RECHECK_INTERVAL:
+        cache['payload'] = {
+            'message': 'Connected to OBS-TV-Animator server',
+            'current_animation': load_state().get('current_animation'),
+            'available_animations': get_animation_files()
+        }
+        cache['checked_at'] = now
+    return cache['payload']
+
+
+def _get_media_lookup():
+    """Return the filename lookup, rebuilding it only when a media directory listing has changed
+    
+    _cached_dir_listing returns the same tuple object while a directory is unchanged, so the
+    check costs one stat per directory and an identity comparison.
+    """
+    cache = _media_lookup_cache
+    animations = _cached_dir_listing(ANIMATIONS_DIR_STR, ('',))
+    videos = _cached_dir_listing(VIDEOS_DIR_STR, ('',))
+    key = cache['key']
+    if key is None or key[0] is not animations or key[1] is not videos:
+        lookup = {name: (VIDEOS_DIR / name, 'video') for name in videos}
+        # Animations directory wins on name collisions (it was always checked first)
+        lookup.update({name: (ANIMATIONS_DIR / name, 'animation') for name in animations})
+        cache['lookup'] = lookup
+        cache['key'] = (animations, videos)
+    return cache['lookup']
 
 
 def find_media_file(filename):
     """Find a media file in either animations or videos directory"""
-    # Try animations directory first
-    animation_path = ANIMATIONS_DIR / filename
-    if animation_path.exists():
-        return animation_path, 'animation'
-    
-    # Try videos directory
-    video_path = VIDEOS_DIR / filename
-    if video_path.exists():
-        return video_path, 'video'
-    
+    found = _get_media_lookup().get(filename)
+    if found is not None:
+        return found
+    # Not listed: a file copied in by hand on a coarse-mtime filesystem (FAT/exFAT) may not have
+    # changed the directory mtime yet, so check the directories directly before giving up
+    if isinstance(filename, str) and is_safe_media_name(filename):
+        for directory, media_type in ((ANIMATIONS_DIR, 'animation'), (VIDEOS_DIR, 'video')):
+            path = directory / filename
+            if path.is_file():
+                invalidate_media_cache()
+                return path, media_type
     return None, None
 
 
+def broadcast_media_change(media_file, media_type, message, reason='media_changed', **extra):
+    """Notify all clients of a media change in a single 'animation_changed' event
+    
+    The payload also carries the page refresh request (refresh_page/reason/new_media),
+    so clients reload from this one frame instead of a separate 'page_refresh' event.
+    """
+    payload = {
+        'current_animation': media_file,
+        'media_type': media_type,
+        'message': message,
+        'refresh_page': True,
+        'reason': reason,
+        'new_media': media_file
+    }
+    payload.update(extra)
+    socketio.emit('animation_changed', payload)
+
+
 @app.route('/')
 def index():
     """Serve the current media (animation or video)"""
@@ -1065,35 +1701,49 @@ def index():
         return serve_video(current_media)
     else:
         # Serve HTML animation
-        return send_from_directory(ANIMATIONS_DIR, current_media)
+        return send_from_directory(ANIMATIONS_DIR_STR, current_media)
+
+
+VIDEO_PLAYER_TEMPLATE = BASE_DIR / "templates" / "video_player_template.html"
+VIDEO_MIME_TYPES = {
+    '.mp4': 'video/mp4',
+    '.webm': 'video/webm',
+    '.ogg': 'video/ogg',
+    '.avi': 'video/avi',
+    '.mov': 'video/quicktime',
+    '.mkv': 'video/x-matroska'
+}
+_VIDEO_PLACEHOLDER_RE = re.compile(r'\{\{ (video_filename|video_url|video_type) \}\}')
+_video_template_cache = (None, None)  # (st_mtime_ns, split template parts)
+
+
+def _get_video_template_parts():
+    """Video player template split into alternating literal text and placeholder names
+    
+    Re-read only when the template file changes on disk.
+    """
+    global _video_template_cache
+    mtime = os.stat(VIDEO_PLAYER_TEMPLATE).st_mtime_ns
+    if _video_template_cache[0] != mtime:
+        with open(VIDEO_PLAYER_TEMPLATE, 'r', encoding='utf-8') as f:
+            _video_template_cache = (mtime, _VIDEO_PLACEHOLDER_RE.split(f.read()))
+    return _video_template_cache[1]
 
 
 def serve_video(video_filename):
     """Serve a video file using the video player template"""
-    video_path = VIDEOS_DIR / video_filename
     video_url = f"/videos/{video_filename}"
     
     # Determine video MIME type
-    video_ext = Path(video_filename).suffix.lower()
-    video_types = {
-        '.mp4': 'video/mp4',
-        '.webm': 'video/webm',
-        '.ogg': 'video/ogg',
-        '.avi': 'video/avi',
-        '.mov': 'video/quicktime',
-        '.mkv': 'video/x-matroska'
-    }
-    video_type = video_types.get(video_ext, 'video/mp4')
+    video_ext = os.path.splitext(video_filename)[1].lower()
+    video_type = VIDEO_MIME_TYPES.get(video_ext, 'video/mp4')
     
     # Load and render the video player template
     try:
-        with open('templates/video_player_template.html', 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        # Simple template replacement (you could use Jinja2 for more complex templating)
-        html_content = template_content.replace('{{ video_filename }}', video_filename)
-        html_content = html_content.replace('{{ video_url }}', video_url)
-        html_content = html_content.replace('{{ video_type }}', video_type)
+        # Simple template substitution (you could use Jinja2 for more complex templating)
+        values = {'video_filename': video_filename, 'video_url': video_url, 'video_type': video_type}
+        parts = _get_video_template_parts()
+        html_content = ''.join(values[part] if i % 2 else part for i, part in enumerate(parts))
         
         return html_content, 200, {'Content-Type': 'text/html'}
     
@@ -1103,8 +1753,8 @@ def serve_video(video_filename):
 
 @app.route('/videos/<filename>')
 def serve_video_file(filename):
-    """Serve video files from the videos directory"""
-    return send_from_directory(VIDEOS_DIR, filename)
+    """Serve video files from the videos directory (Range requests, ETag revalidation, 1h browser cache)"""
+    return send_from_directory(VIDEOS_DIR_STR, filename, conditional=True, etag=True, max_age=3600)
 
 
 @app.route('/mobile')
@@ -1129,12 +1779,12 @@ def trigger():
         # Validate that the media file exists
         media_path, media_type = find_media_file(media_file)
         if not media_path:
-            available_media = get_all_media_files()
+            animations, videos, available_media = get_media_inventory()
             return jsonify({
                 "error": f"Media file '{media_file}' not found",
                 "available_media": available_media,
-                "available_animations": get_animation_files(),
-                "available_videos": get_video_files()
+                "available_animations": animations,
+                "available_videos": videos
             }), 404
         
         # Update state
@@ -1142,22 +1792,9 @@ def trigger():
         state['current_animation'] = media_file
         save_state(state)
 
-        # Emit animation change to all clients
-        socketio.emit('animation_changed', {
-            'current_animation': media_file,
-            'media_type': media_type,
-            'message': f"Media changed to '{media_file}' ({media_type})",
-            'refresh_page': True
-        })
-        print(f"📡 [TRIGGER] Emitted 'animation_changed' for '{media_file}' with refresh_page=True")
-
-        # Emit explicit page refresh
-        socketio.emit('page_refresh', {
-            'reason': 'media_changed',
-            'new_media': media_file,
-            'media_type': media_type
-        })
-        print(f"📡 [TRIGGER] Emitted 'page_refresh' for '{media_file}' - TV should reload now")
+        # Emit animation change (with page refresh request) to all clients
+        broadcast_media_change(media_file, media_type, f"Media changed to '{media_file}' ({media_type})")
+        logger.debug("📡 [TRIGGER] Emitted 'animation_changed' for '%s' with refresh_page=True", media_file)
 
         return jsonify({
             "success": True,
@@ -1180,12 +1817,12 @@ def trigger_get():
         # Validate that the media file exists
         media_path, media_type = find_media_file(media_file)
         if not media_path:
-            available_media = get_all_media_files()
+            animations, videos, available_media = get_media_inventory()
             return jsonify({
                 "error": f"Media file '{media_file}' not found",
                 "available_media": available_media,
-                "available_animations": get_animation_files(),
-                "available_videos": get_video_files()
+                "available_animations": animations,
+                "available_videos": videos
             }), 404
         
         # Update state
@@ -1193,20 +1830,10 @@ def trigger_get():
         state['current_animation'] = media_file
         save_state(state)
 
-        # Emit animation change to all clients
-        socketio.emit('animation_changed', {
-            'current_animation': media_file,
-            'media_type': media_type,
-            'message': f"Media changed to '{media_file}' ({media_type}) via GET trigger",
-            'refresh_page': True
-        })
-
-        # Emit explicit page refresh
-        socketio.emit('page_refresh', {
-            'reason': 'get_trigger',
-            'new_media': media_file,
-            'media_type': media_type
-        })
+        # Emit animation change (with page refresh request) to all clients
+        broadcast_media_change(media_file, media_type,
+                               f"Media changed to '{media_file}' ({media_type}) via GET trigger",
+                               reason='get_trigger')
 
         return jsonify({
             "success": True,
@@ -1221,9 +1848,7 @@ def trigger_get():
 @app.route('/animations', methods=['GET'])
 def list_animations():
     """List all available media files (animations and videos)"""
-    animations = get_animation_files()
-    videos = get_video_files()
-    all_media = get_all_media_files()
+    animations, videos, all_media = get_media_inventory()
     state = load_state()
     current_media = state.get('current_animation', None)
     
@@ -1244,11 +1869,11 @@ def stop_animations():
     """Stop all animations and clear current media"""
     try:
         state = load_state()
-        state['current_animation'] = None
         
-        # Save state
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        # Save state (skip the write when nothing is playing already)
+        if state.get('current_animation') is not None:
+            state['current_animation'] = None
+            save_state(state)
         
         # Emit WebSocket event to notify all connected devices
         socketio.emit('animation_stopped', {
@@ -1268,11 +1893,12 @@ def stop_animations():
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
+    animations, videos, all_media = get_media_inventory()
     return jsonify({
         "status": "healthy",
-        "animations_available": len(get_animation_files()),
-        "videos_available": len(get_video_files()),
-        "total_media_available": len(get_all_media_files())
+        "animations_available": len(animations),
+        "videos_available": len(videos),
+        "total_media_available": len(all_media)
     }), 200
 
 
@@ -1281,7 +1907,6 @@ def health():
 @socketio.on('connect')
 def handle_connect():
     """Handle client WebSocket connection"""
-    import time
     session_id = request.sid
     user_agent = request.headers.get('User-Agent', 'Unknown')
     
@@ -1298,17 +1923,14 @@ def handle_connect():
     
     if device_type == 'admin':
         admin_sessions.add(session_id)
+        join_room(ADMIN_ROOM)
     
-    print(f"Client connected: {session_id} (type: {device_type})")
+    logger.debug("Client connected: %s (type: %s)", session_id, device_type)
     
     # Broadcast device list update to admin clients
-    socketio.emit('devices_updated', get_connected_devices_info(), room=None)
+    schedule_devices_update()
     
-    emit('status', {
-        'message': 'Connected to OBS-TV-Animator server',
-        'current_animation': load_state().get('current_animation'),
-        'available_animations': get_animation_files()
-    })
+    emit('status', get_connect_status_payload())
 
 
 @socketio.on('disconnect')
@@ -1319,10 +1941,10 @@ def handle_disconnect():
     admin_sessions.discard(session_id)
     
     device_type = device_info.get('type', 'unknown')
-    print(f"Client disconnected: {session_id} (type: {device_type})")
+    logger.debug("Client disconnected: %s (type: %s)", session_id, device_type)
     
     # Broadcast device list update to admin clients
-    socketio.emit('devices_updated', get_connected_devices_info(), room=None)
+    schedule_devices_update()
 
 
 @socketio.on('register_admin')
@@ -1332,10 +1954,11 @@ def handle_register_admin():
     if session_id in connected_devices:
         connected_devices[session_id]['type'] = 'admin'
         admin_sessions.add(session_id)
-        print(f"Client {session_id} registered as admin dashboard")
+        join_room(ADMIN_ROOM)
+        logger.info("Client %s registered as admin dashboard", session_id)
         
         # Broadcast updated device list
-        socketio.emit('devices_updated', get_connected_devices_info(), room=None)
+        schedule_devices_update()
 
 
 @socketio.on('trigger_animation')
@@ -1363,27 +1986,15 @@ def handle_trigger_animation(data):
         state['current_animation'] = animation
         save_state(state)
         
-        # Broadcast media change to all connected clients
-        socketio.emit('animation_changed', {
-            'previous_animation': old_animation,
-            'current_animation': animation,
-            'media_type': media_type,
-            'message': f"Media changed to '{animation}' ({media_type})",
-            'refresh_page': True  # Signal TV browsers to refresh
-        }, broadcast=True)
-        
-        # Also send explicit page refresh command for TV browsers
-        socketio.emit('page_refresh', {
-            'reason': 'media_changed',
-            'new_media': animation,
-            'media_type': media_type
-        }, broadcast=True)
+        # Broadcast media change (with page refresh request for TV browsers) to all connected clients
+        broadcast_media_change(animation, media_type, f"Media changed to '{animation}' ({media_type})",
+                               previous_animation=old_animation)
         
-        print(f"Animation changed from '{old_animation}' to '{animation}' via WebSocket")
+        logger.info("Animation changed from '%s' to '%s' via WebSocket", old_animation, animation)
         
     except Exception as e:
         emit('error', {'message': str(e)})
-        print(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
 
 
 @socketio.on('get_status')
@@ -1392,41 +2003,41 @@ def handle_get_status():
     state = load_state()
     current_media = state.get('current_animation')
     media_path, media_type = find_media_file(current_media) if current_media else (None, None)
+    animations, videos, all_media = get_media_inventory()
     
     emit('status', {
         'current_animation': current_media,
         'current_media': current_media,
         'media_type': media_type,
-        'available_animations': get_animation_files(),
-        'available_videos': get_video_files(),
-        'available_media': get_all_media_files(),
-        'animations_count': len(get_animation_files()),
-        'videos_count': len(get_video_files()),
-        'total_media_count': len(get_all_media_files())
+        'available_animations': animations,
+        'available_videos': videos,
+        'available_media': all_media,
+        'animations_count': len(animations),
+        'videos_count': len(videos),
+        'total_media_count': len(all_media)
     })
 
 
+# Default scene-to-animation mapping (lowercase scene names), used when an event has no mapping of its own
+DEFAULT_SCENE_MAPPING = MappingProxyType({
+    'gaming': 'anim1.html',
+    'chatting': 'anim2.html',
+    'brb': 'anim3.html',
+    'be right back': 'anim3.html',
+    'starting soon': 'anim1.html',
+    'ending soon': 'anim2.html'
+})
+
+
 @socketio.on('scene_change')
 def handle_scene_change(data):
     """Handle OBS scene change event"""
     try:
         scene_name = data.get('scene_name', '').lower()
-        animation_mapping = data.get('animation_mapping', {})
+        animation_mapping = data.get('animation_mapping') or {}
         
-        # If specific mapping provided, use it
-        if animation_mapping and scene_name in animation_mapping:
-            animation = animation_mapping[scene_name]
-        else:
-            # Default scene-to-animation mapping
-            default_mapping = {
-                'gaming': 'anim1.html',
-                'chatting': 'anim2.html',
-                'brb': 'anim3.html',
-                'be right back': 'anim3.html',
-                'starting soon': 'anim1.html',
-                'ending soon': 'anim2.html'
-            }
-            animation = default_mapping.get(scene_name)
+        # A specific mapping provided with the event wins over the defaults
+        animation = animation_mapping.get(scene_name) or DEFAULT_SCENE_MAPPING.get(scene_name)
         
         if animation:
             # Trigger animation change
@@ -1438,7 +2049,7 @@ def handle_scene_change(data):
             
     except Exception as e:
         emit('error', {'message': f"Scene change error: {str(e)}"})
-        print(f"Scene change error: {e}")
+        logger.error("Scene change error: %s", e)
 
 
 @socketio.on('streamerbot_event')
@@ -1448,7 +2059,7 @@ def handle_streamerbot_event(data):
         event_type = data.get('event_type')
         event_data = data.get('data', {})
         
-        print(f"StreamerBot event received: {event_type}")
+        logger.info("StreamerBot event received: %s", event_type)
         
         # Handle different StreamerBot event types
         if event_type == 'scene_change':
@@ -1465,7 +2076,7 @@ def handle_streamerbot_event(data):
             
     except Exception as e:
         emit('error', {'message': f"StreamerBot event error: {str(e)}"})
-        print(f"StreamerBot event error: {e}")
+        logger.error("StreamerBot event error: %s", e)
 
 
 @socketio.on('video_control')
@@ -1486,38 +2097,64 @@ def handle_video_control(data):
             emit('error', {'message': 'Current media is not a video file'})
             return
         
-        # Broadcast video control to all connected clients (including the TV)
-        socketio.emit('video_control', {
-            'action': action,
-            'value': value,
-            'message': f"Video control: {action}"
-        }, broadcast=True)
+        # Broadcast video control to all connected clients (including the TV); players only read action/value
+        socketio.emit('video_control', {'action': action, 'value': value})
         
-        print(f"Video control: {action} {f'({value})' if value is not None else ''}")
+        logger.debug("Video control: %s (value: %s)", action, value)
         
     except Exception as e:
         emit('error', {'message': f"Video control error: {str(e)}"})
-        print(f"Video control error: {e}")
+        logger.error("Video control error: %s", e)
+
+
+# Slider drags can fire hundreds of seek/volume events a second; broadcast at most ~60 per second
+VIDEO_CONTROL_MIN_INTERVAL = 1 / 60
+_video_control_lock = threading.Lock()
+_video_control_slots = {}  # {action: {'last': monotonic time of last emit, 'pending': payload or None}}
+
+
+def _flush_video_control(action, delay):
+    """Background task: emit the newest pending value once the throttle window has passed"""
+    socketio.sleep(delay)
+    with _video_control_lock:
+        slot = _video_control_slots[action]
+        payload, slot['pending'] = slot['pending'], None
+        slot['last'] = time.monotonic()
+    socketio.emit('video_control', payload)
+
+
+def emit_video_control_throttled(action, value):
+    """Broadcast a video_control event, coalescing rapid updates so the latest value still arrives"""
+    payload = {'action': action, 'value': value}
+    with _video_control_lock:
+        slot = _video_control_slots.setdefault(action, {'last': 0.0, 'pending': None})
+        if slot['pending'] is not None:
+            # A trailing emit is already scheduled; it will carry this newer value
+            slot['pending'] = payload
+            return
+        wait = slot['last'] + VIDEO_CONTROL_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            slot['pending'] = payload
+            socketio.start_background_task(_flush_video_control, action, wait)
+            return
+        slot['last'] = time.monotonic()
+    socketio.emit('video_control', payload)
 
 
 @socketio.on('video_seek')
 def handle_video_seek(data):
     """Handle video seek commands"""
     try:
-        time = data.get('time', 0)
+        seek_time = data.get('time', 0)
         
         # Broadcast seek command
-        socketio.emit('video_control', {
-            'action': 'seek',
-            'value': time,
-            'message': f"Video seek to {time}s"
-        }, broadcast=True)
+        emit_video_control_throttled('seek', seek_time)
         
-        print(f"Video seek to {time}s")
+        logger.debug("Video seek to %ss", seek_time)
         
     except Exception as e:
         emit('error', {'message': f"Video seek error: {str(e)}"})
-        print(f"Video seek error: {e}")
+        logger.error("Video seek error: %s", e)
 
 
 @socketio.on('video_volume')
@@ -1528,37 +2165,54 @@ def handle_video_volume(data):
         volume = max(0, min(1, float(volume)))  # Clamp between 0 and 1
         
         # Broadcast volume change
-        socketio.emit('video_control', {
-            'action': 'volume',
-            'value': volume,
-            'message': f"Video volume set to {int(volume * 100)}%"
-        }, broadcast=True)
+        emit_video_control_throttled('volume', volume)
         
-        print(f"Video volume set to {int(volume * 100)}%")
+        logger.debug("Video volume set to %d%%", volume * 100)
         
     except Exception as e:
         emit('error', {'message': f"Video volume error: {str(e)}"})
-        print(f"Video volume error: {e}")
+        logger.error("Video volume error: %s", e)
 
 
 # Raw WebSocket Server for StreamerBot Integration
+RAW_WEBSOCKET_MAX_MESSAGE = 64 * 1024  # Largest accepted StreamerBot message (bytes)
+RAW_WEBSOCKET_OUTBOX_SIZE = 256  # Replies queued per client before new ones are dropped
+
+
 class RawWebSocketServer:
     def __init__(self, port=8081):
         self.port = port
         self.clients = set()
         self.server = None
         
+    async def _send_replies(self, websocket, outbox):
+        """Drain a client's reply queue so parsing the next message never waits on a slow send"""
+        try:
+            while True:
+                await websocket.send(await outbox.get())
+        except websockets.exceptions.ConnectionClosed:
+            pass
+    
+    def _queue_reply(self, websocket, outbox, response):
+        """Serialize a reply and queue it for the client's sender task"""
+        try:
+            outbox.put_nowait(_json_text(response))
+        except asyncio.QueueFull:
+            logger.warning("Raw WebSocket reply dropped, outbox full for %s", websocket.remote_address)
+    
     async def handle_client(self, websocket, path):
         """Handle incoming raw WebSocket connections from StreamerBot"""
-        print(f"Raw WebSocket client connected from {websocket.remote_address}")
+        logger.info("Raw WebSocket client connected from %s", websocket.remote_address)
         self.clients.add(websocket)
+        outbox = asyncio.Queue(maxsize=RAW_WEBSOCKET_OUTBOX_SIZE)
+        sender_task = asyncio.ensure_future(self._send_replies(websocket, outbox))
         
         try:
             async for message in websocket:
                 try:
-                    # Parse the incoming message
-                    data = json.loads(message)
-                    print(f"Raw WebSocket message received: {data}")
+                    # Parse the incoming message (binary frames are parsed as bytes, with no UTF-8 decode pass)
+                    data = _json_loads(message)
+                    logger.debug("Raw WebSocket message received: %s", data)
                     
                     # Handle different message types
                     if data.get('action') == 'trigger_animation':
@@ -1578,7 +2232,7 @@ class RawWebSocketServer:
                                     'message': f'Animation file not found: {animation}',
                                     'available_media': available_media
                                 }
-                                await websocket.send(json.dumps(error_response))
+                                self._queue_reply(websocket, outbox, error_response)
                                 continue
                             
                             # Update the current animation state
@@ -1587,27 +2241,12 @@ class RawWebSocketServer:
                             state['current_animation'] = animation
                             save_state(state)
                             
-                            # Determine media type
-                            media_type = "video" if is_video_file(animation) else "animation"
-                            
-                            # Broadcast to all Socket.IO clients (TV displays)
-                            socketio.emit('animation_changed', {
-                                'previous_animation': old_animation,
-                                'current_animation': animation,
-                                'media_type': media_type,
-                                'message': f"Media changed to '{animation}' ({media_type}) via StreamerBot WebSocket",
-                                'refresh_page': force_refresh,
-                                'instant': instant,
-                                'source': source_name
-                            })
-                            
-                            # Send page refresh command for instant TV browser updates
-                            if force_refresh:
-                                socketio.emit('page_refresh', {
-                                    'animation': animation,
-                                    'instant': instant,
-                                    'source': source_name
-                                })
+                            # Broadcast to all Socket.IO clients (TV displays) - refresh_page
+                            # carries the page refresh command for instant TV browser updates
+                            broadcast_media_change(animation, media_type,
+                                                   f"Media changed to '{animation}' ({media_type}) via StreamerBot WebSocket",
+                                                   reason='streamerbot', previous_animation=old_animation,
+                                                   refresh_page=force_refresh, instant=instant, source=source_name)
                             
                             # Send confirmation back to StreamerBot
                             response = {
@@ -1618,14 +2257,14 @@ class RawWebSocketServer:
                                 'force_refresh': force_refresh,
                                 'media_type': media_type
                             }
-                            await websocket.send(json.dumps(response))
-                            print(f"StreamerBot: Animation changed to {animation}")
+                            self._queue_reply(websocket, outbox, response)
+                            logger.info("StreamerBot: Animation changed to %s", animation)
                         else:
                             error_response = {
                                 'status': 'error',
                                 'message': 'Missing animation parameter'
                             }
-                            await websocket.send(json.dumps(error_response))
+                            self._queue_reply(websocket, outbox, error_response)
                     
                     elif data.get('action') == 'get_status':
                         # Send current status
@@ -1636,7 +2275,7 @@ class RawWebSocketServer:
                             'connected_devices': len(connected_devices),
                             'server_version': __version__
                         }
-                        await websocket.send(json.dumps(status_response))
+                        self._queue_reply(websocket, outbox, status_response)
                         
                     else:
                         # Unknown action type
@@ -1644,53 +2283,61 @@ class RawWebSocketServer:
                             'status': 'error',
                             'message': f'Unknown action type: {data.get("action")}'
                         }
-                        await websocket.send(json.dumps(error_response))
+                        self._queue_reply(websocket, outbox, error_response)
                         
                 except json.JSONDecodeError:
                     error_response = {
                         'status': 'error',
                         'message': 'Invalid JSON format'
                     }
-                    await websocket.send(json.dumps(error_response))
+                    self._queue_reply(websocket, outbox, error_response)
                 except Exception as e:
                     error_response = {
                         'status': 'error',
                         'message': f'Server error: {str(e)}'
                     }
-                    await websocket.send(json.dumps(error_response))
-                    print(f"Raw WebSocket error: {e}")
+                    self._queue_reply(websocket, outbox, error_response)
+                    logger.error("Raw WebSocket error: %s", e)
                     
         except websockets.exceptions.ConnectionClosed:
-            print(f"Raw WebSocket client disconnected: {websocket.remote_address}")
+            logger.info("Raw WebSocket client disconnected: %s", websocket.remote_address)
         except Exception as e:
-            print(f"Raw WebSocket handler error: {e}")
+            logger.error("Raw WebSocket handler error: %s", e)
         finally:
             self.clients.discard(websocket)
+            sender_task.cancel()
     
     def start_server(self):
-        """Start the raw WebSocket server in a separate thread"""
+        """Start the raw WebSocket server in a separate thread; the returned event is set once the port is bound"""
+        ready = threading.Event()
+        
         def run_server():
-            loop = asyncio.new_event_loop()
+            loop = _new_event_loop()
             asyncio.set_event_loop(loop)
             
             try:
+                # StreamerBot sends small JSON commands over the LAN: skip per-message
+                # deflate and cap frames well below the 1 MiB default
                 start_server = websockets.serve(
                     self.handle_client, 
                     "0.0.0.0", 
                     self.port,
                     ping_interval=20,
-                    ping_timeout=10
+                    ping_timeout=10,
+                    compression=None,
+                    max_size=RAW_WEBSOCKET_MAX_MESSAGE
                 )
                 
-                print(f"Raw WebSocket server starting on port {self.port} for StreamerBot...")
+                logger.info("Raw WebSocket server starting on port %s for StreamerBot...", self.port)
                 loop.run_until_complete(start_server)
+                ready.set()
                 loop.run_forever()
             except Exception as e:
-                print(f"Raw WebSocket server error: {e}")
+                logger.error("Raw WebSocket server error: %s", e)
         
         thread = threading.Thread(target=run_server, daemon=True)
         thread.start()
-        return thread
+        return ready
 
 # Initialize the raw WebSocket server
 raw_websocket_server = RawWebSocketServer(port=WEBSOCKET_PORT)
@@ -1712,20 +2359,29 @@ def admin_login():
         password = request.form.get('password', '')
         remember = bool(request.form.get('remember'))
         
+        users_data = _get_users_cached() if username and password else {}
+        
         if not username or not password:
             error = "Please enter both username and password."
-        elif verify_password(username, password):
+        elif verify_password(username, password, users_data):
             user = User(username)
             login_user(user, remember=remember)
             
-            # Update last login timestamp
+            # Update last login timestamp (and upgrade legacy plain-text passwords to a hash)
             try:
-                users_data = load_users_config()
-                if username in users_data.get('admin_users', {}):
-                    users_data['admin_users'][username]['last_login'] = datetime.now().isoformat()
-                    save_users_config(users_data)
+                if 'password_hash' not in users_data['admin_users'][username]:
+                    password_hash = generate_password_hash(password)
+                    with _users_file_lock:
+                        users_data = load_users_config()
+                        user_info = users_data['admin_users'][username]
+                        user_info['last_login'] = datetime.now().isoformat()
+                        user_info['password_hash'] = password_hash
+                        user_info.pop('password', None)
+                        save_users_config(users_data)
+                else:
+                    record_last_login(username)
             except Exception as e:
-                print(f"Error updating last login for {username}: {e}")
+                logger.error("Error updating last login for %s: %s", username, e)
             
             # Check if logging in with default credentials
             if username == 'admin' and password == 'admin123':
@@ -1736,197 +2392,137 @@ def admin_login():
                 return redirect(next_page)
             return redirect(url_for('admin_dashboard'))
         else:
-            error = "Invalid username or password."
-    
-    return render_template('admin_login.html', error=error, username=username)
-
-@app.route('/admin/logout')
-@admin_required
-def admin_logout():
-    """Admin logout"""
-    logout_user()
-    return redirect(url_for('index'))
-
-@app.route('/admin')
-@admin_required
-def admin_dashboard():
-    """Admin dashboard for managing animations and monitoring status"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-        print(f"Dashboard: User '{current_user.username}' theme is '{user_theme}'")
-    except Exception as e:
-        print(f"Dashboard: Error loading theme: {e}")
-        user_theme = 'dark'  # Fallback to dark theme
-    
-    # Check for default credentials warning
-    show_credentials_warning = session.pop('show_default_credentials_warning', False)
-    
-    return render_template('admin_dashboard.html', 
-                         user_theme=user_theme,
-                         current_username=current_user.username,
-                         show_credentials_warning=show_credentials_warning,
-                         app_version=__version__)
-
-
-@app.route('/admin/manage')
-@admin_required
-def admin_manage_files():
-    """File management page for uploading/deleting animations"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
-    
-    return render_template('admin_manage.html', 
-                         user_theme=user_theme,
-                         current_username=current_user.username,
-                         app_version=__version__)
-
-
-@app.route('/admin/users')
-@admin_required
-def admin_users():
-    """User management page"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
-    
-    return render_template('admin_users.html', 
-                         user_theme=user_theme,
-                         current_username=current_user.username,
-                         app_version=__version__)
-
-
-@app.route('/admin/obs')
-@admin_required
-def admin_obs_management():
-    """OBS WebSocket management page"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
-    
-    return render_template('admin_obs_management.html', 
-                         user_theme=user_theme,
-                         current_username=current_user.username,
-                         app_version=__version__)
-
-
-@app.route('/admin/instructions')
-@admin_required
-def admin_instructions():
-    """Instructions and setup page"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
-    
-    return render_template('admin_instructions.html', 
-                         user_theme=user_theme,
-                         current_username=current_user.username,
-                         app_version=__version__)
-
-
-@app.route('/admin/instructions/getting-started')
-@admin_required
-def admin_instructions_getting_started():
-    """Getting Started instructions page"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
+            error = "Invalid username or password."
     
-    return render_template('admin_instructions_getting_started.html', 
-                         user_theme=user_theme,
-                         current_username=current_user.username,
-                         app_version=__version__)
+    return render_template('admin_login.html', error=error, username=username)
 
+@app.route('/admin/logout')
+@admin_required
+def admin_logout():
+    """Admin logout"""
+    logout_user()
+    return redirect(url_for('index'))
 
-@app.route('/admin/instructions/obs-integration')
+@app.route('/admin')
 @admin_required
-def admin_instructions_obs():
-    """OBS Studio Integration instructions page"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
+def admin_dashboard():
+    """Admin dashboard for managing animations and monitoring status"""
+    # Check for default credentials warning
+    show_credentials_warning = session.pop('show_default_credentials_warning', False)
     
-    return render_template('admin_instructions_obs.html', 
-                         user_theme=user_theme,
-                         current_username=current_user.username,
-                         app_version=__version__)
+    return _render_admin_page('admin_dashboard.html', show_credentials_warning=show_credentials_warning)
 
 
-@app.route('/admin/instructions/streamerbot-integration')
-@admin_required
-def admin_instructions_streamerbot():
-    """StreamerBot Integration instructions page"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
-    
-    return render_template('admin_instructions_streamerbot.html', 
-                         user_theme=user_theme,
+def _render_admin_page(template, **context):
+    """Render an admin page with the current user's theme, username and app version"""
+    return render_template(template,
+                         user_theme=_get_user_theme(current_user.username),
                          current_username=current_user.username,
-                         app_version=__version__)
+                         app_version=__version__,
+                         **context)
 
 
-@app.route('/admin/instructions/troubleshooting')
-@admin_required
-def admin_instructions_troubleshooting():
-    """Troubleshooting & FAQ instructions page"""
-    # Get user's theme preference
-    try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        user_theme = user_data.get('theme', 'dark')  # Default to dark
-    except Exception:
-        user_theme = 'dark'  # Fallback to dark theme
-    
-    return render_template('admin_instructions_troubleshooting.html', 
+@lru_cache(maxsize=64)
+def _render_static_admin_page(template, user_theme, username, version):
+    """Render a context-free admin page once per theme/user/version combination"""
+    return render_template(template,
                          user_theme=user_theme,
-                         current_username=current_user.username,
-                         app_version=__version__)
+                         current_username=username,
+                         app_version=version)
+
+
+def _admin_page_view(template, doc):
+    """Build an admin-only view that just renders the given template"""
+    def view():
+        # Instruction pages are static apart from the theme/username, so serve them
+        # from memory; debug mode renders every hit so template edits show up
+        if template.startswith('admin_instructions') and not app.debug:
+            username = current_user.username
+            return _render_static_admin_page(template, _get_user_theme(username), username, __version__)
+        return _render_admin_page(template)
+    view.__doc__ = doc
+    return admin_required(view)
+
+
+# Admin pages that only need the theme/username context: (rule, endpoint, template, description)
+ADMIN_PAGES = (
+    ('/admin/manage', 'admin_manage_files', 'admin_manage.html', "File management page for uploading/deleting animations"),
+    ('/admin/users', 'admin_users', 'admin_users.html', "User management page"),
+    ('/admin/obs', 'admin_obs_management', 'admin_obs_management.html', "OBS WebSocket management page"),
+    ('/admin/instructions', 'admin_instructions', 'admin_instructions.html', "Instructions and setup page"),
+    ('/admin/instructions/getting-started', 'admin_instructions_getting_started',
+     'admin_instructions_getting_started.html', "Getting Started instructions page"),
+    ('/admin/instructions/obs-integration', 'admin_instructions_obs',
+     'admin_instructions_obs.html', "OBS Studio Integration instructions page"),
+    ('/admin/instructions/streamerbot-integration', 'admin_instructions_streamerbot',
+     'admin_instructions_streamerbot.html', "StreamerBot Integration instructions page"),
+    ('/admin/instructions/troubleshooting', 'admin_instructions_troubleshooting',
+     'admin_instructions_troubleshooting.html', "Troubleshooting & FAQ instructions page"),
+)
+
+for _rule, _endpoint, _template, _doc in ADMIN_PAGES:
+    app.add_url_rule(_rule, _endpoint, _admin_page_view(_template, _doc))
+
+
+# Held around every users.json load -> edit -> save (API handlers, theme save, login upgrade and
+# the last_login flush) so one writer never overwrites another's change with a stale copy
+_users_file_lock = threading.Lock()
 
 
 def save_users_config(users_data):
-    """Save users configuration to file"""
+    """Save users configuration to file (callers editing users.json hold _users_file_lock)"""
     try:
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(USERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(users_data, f, indent=2, ensure_ascii=False)
+        _atomic_write_json(USERS_FILE, users_data)
         return True
     except Exception as e:
-        print(f"Error saving users config: {e}")
+        logger.error("Error saving users config: %s", e)
         return False
 
 
+# last_login timestamps are batched into one users.json write per LAST_LOGIN_FLUSH_DELAY
+LAST_LOGIN_FLUSH_DELAY = 5.0
+_last_login_lock = threading.Lock()
+_pending_last_login = {}  # {username: ISO timestamp}
+
+
+def _flush_last_logins():
+    """Background task: write all pending last_login timestamps in a single save"""
+    socketio.sleep(LAST_LOGIN_FLUSH_DELAY)
+    with _last_login_lock:
+        pending = dict(_pending_last_login)
+    with _users_file_lock:
+        users_data = load_users_config()
+        admin_users = users_data.get('admin_users', {})
+        for username, timestamp in pending.items():
+            if username in admin_users:
+                admin_users[username]['last_login'] = timestamp
+        saved = save_users_config(users_data)
+    with _last_login_lock:
+        if saved:
+            # Keep entries that were updated again while the file was being written
+            for username, timestamp in pending.items():
+                if _pending_last_login.get(username) == timestamp:
+                    del _pending_last_login[username]
+        # A failed save keeps everything pending and retries after the next delay
+        if _pending_last_login:
+            socketio.start_background_task(_flush_last_logins)
+
+
+def record_last_login(username):
+    """Queue a last_login update for the user, scheduling a flush if none is pending"""
+    with _last_login_lock:
+        schedule = not _pending_last_login
+        _pending_last_login[username] = datetime.now().isoformat()
+    if schedule:
+        socketio.start_background_task(_flush_last_logins)
+
+
+def get_last_login(username, user_info):
+    """Last login time, including an update that has not been written yet"""
+    with _last_login_lock:
+        return _pending_last_login.get(username, user_info.get('last_login'))
+
+
 @app.route('/admin/api/users', methods=['GET'])
 @admin_required
 def api_get_users():
@@ -1940,7 +2536,7 @@ def api_get_users():
             user_list.append({
                 'username': username,
                 'created_at': user_info.get('created_at'),
-                'last_login': user_info.get('last_login'),
+                'last_login': get_last_login(username, user_info),
                 'permissions': user_info.get('permissions', [])
             })
         
@@ -1951,7 +2547,7 @@ def api_get_users():
         })
     
     except Exception as e:
-        print(f"Error getting users: {e}")
+        logger.error("Error getting users: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -1973,29 +2569,31 @@ def api_add_user():
         if len(password) < 6:
             return jsonify({'success': False, 'error': 'Password must be at least 6 characters long'}), 400
         
-        users_data = load_users_config()
-        admin_users = users_data.get('admin_users', {})
+        # Hash outside the users.json lock; it is the slow part
+        password_hash = generate_password_hash(password)
         
-        if username in admin_users:
-            return jsonify({'success': False, 'error': 'Username already exists'}), 400
+        with _users_file_lock:
+            users_data = load_users_config()
+            admin_users = users_data.setdefault('admin_users', {})
         
-        # Add new user
-        admin_users[username] = {
-            'password': password,  # In production, hash this!
-            'created_at': datetime.now().isoformat(),
-            'permissions': ['read', 'write', 'delete', 'upload'],
-            'theme': 'dark'  # Default theme
-        }
+            if username in admin_users:
+                return jsonify({'success': False, 'error': 'Username already exists'}), 400
         
-        users_data['admin_users'] = admin_users
+            # Add new user
+            admin_users[username] = {
+                'password_hash': password_hash,
+                'created_at': datetime.now().isoformat(),
+                'permissions': ['read', 'write', 'delete', 'upload'],
+                'theme': 'dark'  # Default theme
+            }
         
-        if save_users_config(users_data):
-            return jsonify({'success': True, 'message': f'User {username} added successfully'})
-        else:
-            return jsonify({'success': False, 'error': 'Failed to save user data'}), 500
+            if save_users_config(users_data):
+                return jsonify({'success': True, 'message': f'User {username} added successfully'})
+            else:
+                return jsonify({'success': False, 'error': 'Failed to save user data'}), 500
     
     except Exception as e:
-        print(f"Error adding user: {e}")
+        logger.error("Error adding user: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -2013,27 +2611,27 @@ def api_delete_user():
         if username == current_user.username:
             return jsonify({'success': False, 'error': 'Cannot delete your own account'}), 400
         
-        users_data = load_users_config()
-        admin_users = users_data.get('admin_users', {})
+        with _users_file_lock:
+            users_data = load_users_config()
+            admin_users = users_data.setdefault('admin_users', {})
         
-        if username not in admin_users:
-            return jsonify({'success': False, 'error': 'User not found'}), 404
+            if username not in admin_users:
+                return jsonify({'success': False, 'error': 'User not found'}), 404
         
-        # Prevent deleting the last remaining user
-        if len(admin_users) <= 1:
-            return jsonify({'success': False, 'error': 'Cannot delete the last remaining user'}), 400
+            # Prevent deleting the last remaining user
+            if len(admin_users) <= 1:
+                return jsonify({'success': False, 'error': 'Cannot delete the last remaining user'}), 400
         
-        # Delete user
-        del admin_users[username]
-        users_data['admin_users'] = admin_users
+            # Delete user
+            del admin_users[username]
         
-        if save_users_config(users_data):
-            return jsonify({'success': True, 'message': f'User {username} deleted successfully'})
-        else:
-            return jsonify({'success': False, 'error': 'Failed to save user data'}), 500
+            if save_users_config(users_data):
+                return jsonify({'success': True, 'message': f'User {username} deleted successfully'})
+            else:
+                return jsonify({'success': False, 'error': 'Failed to save user data'}), 500
     
     except Exception as e:
-        print(f"Error deleting user: {e}")
+        logger.error("Error deleting user: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -2052,27 +2650,32 @@ def api_change_password():
         if len(new_password) < 6:
             return jsonify({'success': False, 'error': 'New password must be at least 6 characters long'}), 400
         
-        # Verify current password
-        if not verify_password(current_user.username, current_password):
-            return jsonify({'success': False, 'error': 'Current password is incorrect'}), 400
+        # Hash outside the users.json lock; it is the slow part
+        new_password_hash = generate_password_hash(new_password)
         
-        users_data = load_users_config()
-        admin_users = users_data.get('admin_users', {})
+        with _users_file_lock:
+            users_data = load_users_config()
         
-        if current_user.username not in admin_users:
-            return jsonify({'success': False, 'error': 'User not found'}), 404
+            # Verify current password
+            if not verify_password(current_user.username, current_password, users_data):
+                return jsonify({'success': False, 'error': 'Current password is incorrect'}), 400
         
-        # Update password
-        admin_users[current_user.username]['password'] = new_password  # In production, hash this!
-        users_data['admin_users'] = admin_users
+            admin_users = users_data.setdefault('admin_users', {})
         
-        if save_users_config(users_data):
-            return jsonify({'success': True, 'message': 'Password changed successfully'})
-        else:
-            return jsonify({'success': False, 'error': 'Failed to save password change'}), 500
+            if current_user.username not in admin_users:
+                return jsonify({'success': False, 'error': 'User not found'}), 404
+        
+            # Update password (store only the salted hash, dropping any legacy plain-text entry)
+            admin_users[current_user.username]['password_hash'] = new_password_hash
+            admin_users[current_user.username].pop('password', None)
+        
+            if save_users_config(users_data):
+                return jsonify({'success': True, 'message': 'Password changed successfully'})
+            else:
+                return jsonify({'success': False, 'error': 'Failed to save password change'}), 500
     
     except Exception as e:
-        print(f"Error changing password: {e}")
+        logger.error("Error changing password: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -2093,22 +2696,24 @@ def admin_status():
         if obs_client:
             obs_connected = obs_client.connected
         
+        animations, videos, all_media = get_media_inventory()
+        
         return jsonify({
             'status': 'running',
             'current_media': current_media,
             'media_type': media_type,
-            'animations_count': len(get_animation_files()),
-            'videos_count': len(get_video_files()),
-            'total_media_count': len(get_all_media_files()),
+            'animations_count': len(animations),
+            'videos_count': len(videos),
+            'total_media_count': len(all_media),
             'connected_clients': devices_info['tv_count'],  # Only count TV devices, not admin
             'tv_devices': devices_info['tv_devices'],
             'admin_count': devices_info['admin_count'],
             'streamerbot_devices': devices_info['streamerbot_devices'],
             'streamerbot_count': devices_info['streamerbot_count'],
             'total_connections': devices_info['total_count'],
-            'available_animations': get_animation_files(),
-            'available_videos': get_video_files(),
-            'available_media': get_all_media_files(),
+            'available_animations': animations,
+            'available_videos': videos,
+            'available_media': all_media,
             'obs_connected': obs_connected
         })
     except Exception as e:
@@ -2120,29 +2725,7 @@ def admin_status():
 def admin_list_files():
     """API endpoint to list all files with metadata"""
     try:
-        files = []
-        
-        # Add animation files
-        for filename in get_animation_files():
-            file_path = ANIMATIONS_DIR / filename
-            files.append({
-                'name': filename,
-                'type': 'animation',
-                'size': file_path.stat().st_size if file_path.exists() else 0,
-                'url': f'/animations/{filename}',
-                'thumbnail': f'/admin/api/thumbnail/{filename}'
-            })
-        
-        # Add video files
-        for filename in get_video_files():
-            file_path = VIDEOS_DIR / filename
-            files.append({
-                'name': filename,
-                'type': 'video',
-                'size': file_path.stat().st_size if file_path.exists() else 0,
-                'url': f'/videos/{filename}',
-                'thumbnail': f'/admin/api/thumbnail/{filename}'
-            })
+        files = list_media_file_entries()
         
         return jsonify({'files': files})
     except Exception as e:
@@ -2153,29 +2736,7 @@ def admin_list_files():
 def list_files():
     """Public API endpoint to list all files for mobile interface"""
     try:
-        files = []
-        
-        # Add animation files
-        for filename in get_animation_files():
-            file_path = ANIMATIONS_DIR / filename
-            files.append({
-                'name': filename,
-                'type': 'animation',
-                'size': file_path.stat().st_size if file_path.exists() else 0,
-                'url': f'/animations/{filename}',
-                'thumbnail': f'/admin/api/thumbnail/{filename}'
-            })
-        
-        # Add video files  
-        for filename in get_video_files():
-            file_path = VIDEOS_DIR / filename
-            files.append({
-                'name': filename,
-                'type': 'video',
-                'size': file_path.stat().st_size if file_path.exists() else 0,
-                'url': f'/videos/{filename}',
-                'thumbnail': f'/admin/api/thumbnail/{filename}'
-            })
+        files = list_media_file_entries()
         
         # Get current animation state
         state = load_state()
@@ -2189,6 +2750,74 @@ def list_files():
         return jsonify({'error': str(e)}), 500
 
 
+# Placeholder thumbnails served while a real one is missing; {label} is the escaped, truncated file name
+HTML_PLACEHOLDER_SVG = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="320" height="180" xmlns="http://www.w3.org/2000/svg">
+  <rect width="320" height="180" fill="#2c3e50"/>
+  <text x="160" y="95" text-anchor="middle" fill="white" font-family="Arial" font-size="16">{label}</text>
+  <text x="160" y="115" text-anchor="middle" fill="#bdc3c7" font-family="Arial" font-size="12">HTML Animation</text>
+</svg>'''
+
+VIDEO_PLACEHOLDER_SVG = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="320" height="180" xmlns="http://www.w3.org/2000/svg">
+  <rect width="320" height="180" fill="#34495e"/>
+  <polygon points="140,70 140,110 180,90" fill="white"/>
+  <text x="160" y="135" text-anchor="middle" fill="white" font-family="Arial" font-size="14">{label}</text>
+  <text x="160" y="155" text-anchor="middle" fill="#bdc3c7" font-family="Arial" font-size="10">Video File</text>
+</svg>'''
+
+# Short max-age: the real thumbnail is served from the same URL once it has been generated
+PLACEHOLDER_SVG_HEADERS = {'Content-Type': 'image/svg+xml', 'Cache-Control': 'private, max-age=60'}
+
+
+# Thumbnail jobs share the background loop; the semaphore bounds how many browsers/FFmpeg runs overlap
+THUMBNAIL_WORKERS = 2
+THUMBNAIL_TIMEOUT = 30  # seconds a request waits for an on-demand thumbnail before falling back to SVG
+_thumbnail_slots = asyncio.Semaphore(THUMBNAIL_WORKERS)
+_thumbnail_inflight = {}  # {filename: concurrent future} for jobs still running
+_thumbnail_inflight_lock = threading.Lock()
+
+
+async def _generate_thumbnail_limited(thumbnail_service, filename, file_path):
+    """Generate one thumbnail once a worker slot is free"""
+    async with _thumbnail_slots:
+        return await thumbnail_service.generate_thumbnail(filename, file_path)
+
+
+def submit_thumbnail(thumbnail_service, filename, file_path):
+    """Queue thumbnail generation on the background loop; the future resolves to (success, thumbnail_name)
+    
+    Concurrent requests for the same file share the job that is already running.
+    """
+    with _thumbnail_inflight_lock:
+        future = _thumbnail_inflight.get(filename)
+        if future is not None:
+            return future
+        future = run_in_background(_generate_thumbnail_limited(thumbnail_service, filename, file_path))
+        _thumbnail_inflight[filename] = future
+    # Outside the lock: the callback runs immediately if the job has already finished
+    future.add_done_callback(lambda _: _forget_thumbnail_job(filename, future))
+    return future
+
+
+def _forget_thumbnail_job(filename, future):
+    """Drop a finished job from the in-flight map (unless a newer job has replaced it)"""
+    with _thumbnail_inflight_lock:
+        if _thumbnail_inflight.get(filename) is future:
+            del _thumbnail_inflight[filename]
+
+
+async def _generate_all_thumbnails(thumbnail_service):
+    """Generate thumbnails for every media file, then drop thumbnails whose source is gone"""
+    async with _thumbnail_slots:
+        results = await thumbnail_service.generate_all_thumbnails(Path(ANIMATIONS_DIR), Path(VIDEOS_DIR))
+    logger.info("Thumbnail generation complete: %s", results)
+    results['orphaned_cleaned'] = await asyncio.to_thread(
+        thumbnail_service.cleanup_orphaned_thumbnails, Path(ANIMATIONS_DIR), Path(VIDEOS_DIR)
+    )
+    return results
+
+
 @app.route('/admin/api/upload', methods=['POST'])
 @admin_required
 def admin_upload_file():
@@ -2201,20 +2830,22 @@ def admin_upload_file():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        filename = file.filename
-        file_ext = Path(filename).suffix.lower()
+        # Strip directory parts and unsafe characters so the file always lands in the media folder
+        filename = secure_filename(file.filename)
+        if not filename:
+            return jsonify({'error': 'Invalid file name'}), 400
         
         # Determine file type and destination
-        if file_ext in HTML_EXTENSIONS:
+        if is_html_file(filename):
             destination_dir = ANIMATIONS_DIR
             file_type = 'animation'
-        elif file_ext in VIDEO_EXTENSIONS:
+        elif is_video_file(filename):
             destination_dir = VIDEOS_DIR
             file_type = 'video'
         else:
             return jsonify({
-                'error': f'Unsupported file type: {file_ext}',
-                'supported_types': list(HTML_EXTENSIONS | VIDEO_EXTENSIONS)
+                'error': f'Unsupported file type: {Path(filename).suffix.lower()}',
+                'supported_types': SUPPORTED_UPLOAD_TYPES
             }), 400
         
         # Ensure destination directory exists
@@ -2222,32 +2853,23 @@ def admin_upload_file():
         
         # Save file
         file_path = destination_dir / filename
-        file.save(str(file_path))
+        file.save(str(file_path), buffer_size=UPLOAD_COPY_BUFFER)
+        invalidate_media_cache()
         
-        # Generate thumbnail asynchronously
+        # Generate thumbnail asynchronously on the shared background loop
         try:
-            thumbnail_service = get_thumbnail_service(f"http://localhost:{get_current_port()}")
-            
-            def generate_thumbnail_background():
-                """Generate thumbnail in background thread"""
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    success, thumbnail_name = loop.run_until_complete(
-                        thumbnail_service.generate_thumbnail(filename, file_path)
-                    )
-                    loop.close()
-                    
-                    if success:
-                        app.logger.info(f"Generated thumbnail for uploaded file: {filename}")
-                    else:
-                        app.logger.warning(f"Failed to generate thumbnail for uploaded file: {filename}")
-                        
-                except Exception as e:
-                    app.logger.error(f"Thumbnail generation error for {filename}: {str(e)}")
+            thumbnail_service = get_thumbnail_service(THUMBNAIL_BASE_URL)
+            
+            def log_thumbnail_result(future):
+                if future.cancelled() or future.exception() is not None:
+                    return  # Failures are logged by run_in_background
+                success, thumbnail_name = future.result()
+                if success:
+                    app.logger.info(f"Generated thumbnail for uploaded file: {filename}")
+                else:
+                    app.logger.warning(f"Failed to generate thumbnail for uploaded file: {filename}")
             
-            # Start thumbnail generation in background thread
-            Thread(target=generate_thumbnail_background, daemon=True).start()
+            submit_thumbnail(thumbnail_service, filename, file_path).add_done_callback(log_thumbnail_result)
             
         except Exception as e:
             app.logger.warning(f"Could not start thumbnail generation for {filename}: {str(e)}")
@@ -2268,6 +2890,8 @@ def admin_upload_file():
 @admin_required
 def admin_delete_file(file_type, filename):
     """Delete a file (animation or video)"""
+    if not is_safe_media_name(filename):
+        return jsonify({'error': 'Invalid filename'}), 400
     try:
         if file_type == 'animation':
             file_path = ANIMATIONS_DIR / filename
@@ -2287,10 +2911,11 @@ def admin_delete_file(file_type, filename):
         
         # Delete file
         file_path.unlink()
+        invalidate_media_cache()
         
         # Clean up thumbnail if it exists
         try:
-            thumbnail_service = get_thumbnail_service(f"http://localhost:{get_current_port()}")
+            thumbnail_service = get_thumbnail_service(THUMBNAIL_BASE_URL)
             # Use get_thumbnail_path directly for more reliable deletion
             thumbnail_path = thumbnail_service.get_thumbnail_path(filename)
             if thumbnail_path.exists():
@@ -2308,96 +2933,69 @@ def admin_delete_file(file_type, filename):
         return jsonify({'error': str(e)}), 500
 
 
+THUMBNAIL_MAX_AGE = 86400  # seconds; only for versioned (?v=<source mtime>) thumbnail URLs
+
+
+def _placeholder_svg_response(filename, file_ext):
+    """Placeholder SVG response labelled with the (escaped, truncated) file name"""
+    label = escape(filename[:25] + ('...' if len(filename) > 25 else ''))
+    template = HTML_PLACEHOLDER_SVG if file_ext in THUMBNAIL_HTML_EXTENSIONS else VIDEO_PLACEHOLDER_SVG
+    return template.format(label=label), 200, PLACEHOLDER_SVG_HEADERS
+
+
+def _send_thumbnail(thumbnail_path):
+    """Send a thumbnail PNG with Last-Modified/ETag so repeat visits get 304s
+    
+    Versioned URLs (as handed out by the file lists) change whenever the source file does,
+    so those can be cached outright; bare URLs are revalidated on every use.
+    """
+    response = send_file(thumbnail_path, mimetype='image/png', conditional=True, etag=True,
+                         max_age=THUMBNAIL_MAX_AGE if request.args.get('v') else 0)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
+
+
 @app.route('/admin/api/thumbnail/<filename>')
 @admin_required
 def admin_thumbnail(filename):
     """Generate or serve thumbnails for files"""
+    if not is_safe_media_name(filename):
+        return jsonify({'error': 'Invalid filename'}), 400
     try:
         # Get the thumbnail service
-        thumbnail_service = get_thumbnail_service(f"http://localhost:{get_current_port()}")
-        
-        # Try to serve existing thumbnail
-        thumbnail_path = thumbnail_service.serve_thumbnail(filename)
-        if thumbnail_path:
-            return send_from_directory(
-                str(thumbnail_path.parent), 
-                thumbnail_path.name,
-                mimetype='image/png'
-            )
-        
-        # If no thumbnail exists, try to generate one
-        file_ext = filename.lower().split('.')[-1]
-        
-        if file_ext in ['html', 'htm']:
-            # Check if HTML file exists
-            html_path = Path(ANIMATIONS_DIR) / filename
-            if html_path.exists():
-                # Generate thumbnail asynchronously
-                try:
-                    # Create event loop for async thumbnail generation
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    success, thumbnail_name = loop.run_until_complete(
-                        thumbnail_service.generate_thumbnail(filename, html_path)
-                    )
-                    loop.close()
-                    
-                    if success:
-                        # Serve the newly generated thumbnail
-                        thumbnail_path = thumbnail_service.serve_thumbnail(filename)
-                        if thumbnail_path:
-                            return send_from_directory(
-                                str(thumbnail_path.parent), 
-                                thumbnail_path.name,
-                                mimetype='image/png'
-                            )
-                except Exception as e:
-                    app.logger.warning(f"Failed to generate HTML thumbnail for {filename}: {str(e)}")
+        thumbnail_service = get_thumbnail_service(THUMBNAIL_BASE_URL)
+        
+        # Fast path: serve an existing thumbnail straight from its predictable location
+        thumbnail_path = thumbnail_service.get_thumbnail_path(filename)
+        if thumbnail_path.is_file():
+            return _send_thumbnail(thumbnail_path)
+        
+        # If no thumbnail exists, try to generate one on the background loop and wait for it
+        file_ext = os.path.splitext(filename)[1].lower()
+        if file_ext in THUMBNAIL_HTML_EXTENSIONS:
+            source_path, kind = ANIMATIONS_DIR / filename, 'HTML'
+        elif file_ext in THUMBNAIL_VIDEO_EXTENSIONS:
+            source_path, kind = VIDEOS_DIR / filename, 'video'
+        else:
+            source_path = kind = None
         
-        elif file_ext in ['mp4', 'webm', 'mov', 'avi', 'mkv']:
-            # Check if video file exists
-            video_path = Path(VIDEOS_DIR) / filename
-            if video_path.exists():
-                # Generate thumbnail synchronously (FFmpeg)
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    success, thumbnail_name = loop.run_until_complete(
-                        thumbnail_service.generate_thumbnail(filename, video_path)
-                    )
-                    loop.close()
-                    
-                    if success:
-                        # Serve the newly generated thumbnail
-                        thumbnail_path = thumbnail_service.serve_thumbnail(filename)
-                        if thumbnail_path:
-                            return send_from_directory(
-                                str(thumbnail_path.parent), 
-                                thumbnail_path.name,
-                                mimetype='image/png'
-                            )
-                except Exception as e:
-                    app.logger.warning(f"Failed to generate video thumbnail for {filename}: {str(e)}")
+        if source_path is not None and source_path.exists():
+            try:
+                success, thumbnail_name = submit_thumbnail(
+                    thumbnail_service, filename, source_path
+                ).result(timeout=THUMBNAIL_TIMEOUT)
+                
+                if success:
+                    # Serve the newly generated thumbnail
+                    thumbnail_path = thumbnail_service.serve_thumbnail(filename)
+                    if thumbnail_path:
+                        return _send_thumbnail(thumbnail_path)
+            except Exception as e:
+                app.logger.warning(f"Failed to generate {kind} thumbnail for {filename}: {str(e)}")
         
         # Fallback to SVG placeholders if thumbnail generation fails
-        if file_ext in ['html', 'htm']:
-            svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="320" height="180" xmlns="http://www.w3.org/2000/svg">
-  <rect width="320" height="180" fill="#2c3e50"/>
-  <text x="160" y="95" text-anchor="middle" fill="white" font-family="Arial" font-size="16">{filename[:25]}{'...' if len(filename) > 25 else ''}</text>
-  <text x="160" y="115" text-anchor="middle" fill="#bdc3c7" font-family="Arial" font-size="12">HTML Animation</text>
-</svg>'''
-            return svg_content, 200, {'Content-Type': 'image/svg+xml'}
-        
-        else:
-            svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="320" height="180" xmlns="http://www.w3.org/2000/svg">
-  <rect width="320" height="180" fill="#34495e"/>
-  <polygon points="140,70 140,110 180,90" fill="white"/>
-  <text x="160" y="135" text-anchor="middle" fill="white" font-family="Arial" font-size="14">{filename[:25]}{'...' if len(filename) > 25 else ''}</text>
-  <text x="160" y="155" text-anchor="middle" fill="#bdc3c7" font-family="Arial" font-size="10">Video File</text>
-</svg>'''
-            return svg_content, 200, {'Content-Type': 'image/svg+xml'}
+        return _placeholder_svg_response(filename, file_ext)
         
     except Exception as e:
         app.logger.error(f"Thumbnail generation error for {filename}: {str(e)}")
@@ -2409,41 +3007,10 @@ def admin_thumbnail(filename):
 def admin_generate_thumbnails():
     """Generate thumbnails for all files"""
     try:
-        thumbnail_service = get_thumbnail_service(f"http://localhost:{get_current_port()}")
-        
-        def generate_all_thumbnails():
-            """Generate thumbnails for all files in background"""
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                results = loop.run_until_complete(
-                    thumbnail_service.generate_all_thumbnails(
-                        Path(ANIMATIONS_DIR), 
-                        Path(VIDEOS_DIR)
-                    )
-                )
-                
-                loop.close()
-                
-                # Log results
-                app.logger.info(f"Thumbnail generation complete: {results}")
-                
-                # Cleanup orphaned thumbnails
-                cleaned_count = thumbnail_service.cleanup_orphaned_thumbnails(
-                    Path(ANIMATIONS_DIR), 
-                    Path(VIDEOS_DIR)
-                )
-                results['orphaned_cleaned'] = cleaned_count
-                
-                return results
-                
-            except Exception as e:
-                app.logger.error(f"Bulk thumbnail generation failed: {str(e)}")
-                return {'error': str(e)}
+        thumbnail_service = get_thumbnail_service(THUMBNAIL_BASE_URL)
         
-        # Start generation in background thread
-        Thread(target=generate_all_thumbnails, daemon=True).start()
+        # Results are logged by _generate_all_thumbnails once the background run finishes
+        run_in_background(_generate_all_thumbnails(thumbnail_service))
         
         return jsonify({
             'success': True,
@@ -2454,45 +3021,97 @@ def admin_generate_thumbnails():
         return jsonify({'error': str(e)}), 500
 
 
+# Per-process salt so ETags issued before a restart (counters reset to 0) never match
+_THUMBNAIL_ETAG_EPOCH = time.time_ns()
+
+
+def _thumbnail_listing_etag(thumbnail_service):
+    """ETag for the thumbnail status/debug listings: a directory stat each plus change counters"""
+    parts = [_THUMBNAIL_ETAG_EPOCH, _media_generation, thumbnail_service.generation]
+    for directory in (ANIMATIONS_DIR_STR, VIDEOS_DIR_STR, str(thumbnail_service.thumbnails_dir)):
+        try:
+            parts.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            parts.append(0)
+    return hashlib.md5('-'.join(map(str, parts)).encode()).hexdigest()
+
+
+def _conditional_json(etag, build_payload):
+    """304 if the client already has this ETag, otherwise the JSON payload tagged with it"""
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(build_payload())
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _thumbnail_status_payload(thumbnail_service):
+    """Counts of media files and how many have an up-to-date thumbnail"""
+    # One scandir pass per directory; thumbnail freshness is compared from these
+    # mtimes instead of stat'ing each thumbnail/source pair. Only the thumbnail
+    # mtimes are held in memory, the media directories are streamed and counted.
+    thumbnails = dict(_iter_file_mtimes(str(thumbnail_service.thumbnails_dir), ('.png',)))
+    counts = []
+    files_with_thumbnails = 0
+    for directory, extensions in ((ANIMATIONS_DIR_STR, HTML_EXT_TUPLE), (VIDEOS_DIR_STR, VIDEO_EXT_TUPLE)):
+        count = 0
+        for name, mtime in _iter_file_mtimes(directory, extensions):
+            count += 1
+            # A file counts as covered when its thumbnail is newer than the source (see thumbnail_exists)
+            if thumbnails.get(thumbnail_service.get_thumbnail_path(name).name, 0) > mtime:
+                files_with_thumbnails += 1
+        counts.append(count)
+    html_count, video_count = counts
+    
+    thumbnail_count = len(thumbnails)
+    total_files = html_count + video_count
+    
+    return {
+        'total_files': total_files,
+        'html_files': html_count,
+        'video_files': video_count,
+        'thumbnail_count': thumbnail_count,
+        'files_with_thumbnails': files_with_thumbnails,
+        'completion_percentage': round((files_with_thumbnails / total_files * 100) if total_files > 0 else 100, 1)
+    }
+
+
+def _thumbnail_debug_payload(thumbnail_service):
+    """Name, size and mtime of every thumbnail file"""
+    # List all PNG files in thumbnails directory, stat'ing each entry once
+    thumbnail_files = []
+    try:
+        with os.scandir(thumbnail_service.thumbnails_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.png') and entry.is_file():
+                    stat = entry.stat()
+                    thumbnail_files.append({
+                        'filename': entry.name,
+                        'size_bytes': stat.st_size,
+                        'modified': stat.st_mtime
+                    })
+    except FileNotFoundError:
+        pass
+    
+    return {
+        'thumbnails_directory': str(thumbnail_service.thumbnails_dir),
+        'directory_exists': thumbnail_service.thumbnails_dir.exists(),
+        'thumbnail_files': thumbnail_files,
+        'total_thumbnails': len(thumbnail_files)
+    }
+
+
 @app.route('/admin/api/thumbnails/status', methods=['GET'])
 @admin_required
 def admin_thumbnails_status():
-    """Get thumbnail generation status"""
+    """Get thumbnail generation status (304 while nothing has changed since the client's copy)"""
     try:
-        thumbnail_service = get_thumbnail_service(f"http://localhost:{get_current_port()}")
-        
-        # Count existing thumbnails
-        thumbnail_count = len(list(thumbnail_service.thumbnails_dir.glob('*.png')))
-        
-        # Count files that need thumbnails
-        html_files = list(Path(ANIMATIONS_DIR).glob('*.html')) if Path(ANIMATIONS_DIR).exists() else []
-        video_extensions = ['*.mp4', '*.webm', '*.mov', '*.avi', '*.mkv']
-        video_files = []
-        
-        if Path(VIDEOS_DIR).exists():
-            for pattern in video_extensions:
-                video_files.extend(list(Path(VIDEOS_DIR).glob(pattern)))
-        
-        total_files = len(html_files) + len(video_files)
-        
-        # Check which files have thumbnails
-        files_with_thumbnails = 0
-        for html_file in html_files:
-            if thumbnail_service.thumbnail_exists(html_file.name, html_file):
-                files_with_thumbnails += 1
-        
-        for video_file in video_files:
-            if thumbnail_service.thumbnail_exists(video_file.name, video_file):
-                files_with_thumbnails += 1
-        
-        return jsonify({
-            'total_files': total_files,
-            'html_files': len(html_files),
-            'video_files': len(video_files),
-            'thumbnail_count': thumbnail_count,
-            'files_with_thumbnails': files_with_thumbnails,
-            'completion_percentage': round((files_with_thumbnails / total_files * 100) if total_files > 0 else 100, 1)
-        })
+        thumbnail_service = get_thumbnail_service(THUMBNAIL_BASE_URL)
+        return _conditional_json(_thumbnail_listing_etag(thumbnail_service),
+                                 lambda: _thumbnail_status_payload(thumbnail_service))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -2503,25 +3122,9 @@ def admin_thumbnails_status():
 def admin_thumbnails_debug():
     """Debug endpoint to list actual thumbnail files"""
     try:
-        thumbnail_service = get_thumbnail_service(f"http://localhost:{get_current_port()}")
-        
-        # List all PNG files in thumbnails directory
-        thumbnail_files = list(thumbnail_service.thumbnails_dir.glob('*.png'))
-        
-        debug_info = {
-            'thumbnails_directory': str(thumbnail_service.thumbnails_dir),
-            'directory_exists': thumbnail_service.thumbnails_dir.exists(),
-            'thumbnail_files': [
-                {
-                    'filename': f.name,
-                    'size_bytes': f.stat().st_size if f.exists() else 0,
-                    'modified': f.stat().st_mtime if f.exists() else 0
-                } for f in thumbnail_files
-            ],
-            'total_thumbnails': len(thumbnail_files)
-        }
-        
-        return jsonify(debug_info)
+        thumbnail_service = get_thumbnail_service(THUMBNAIL_BASE_URL)
+        return _conditional_json(_thumbnail_listing_etag(thumbnail_service),
+                                 lambda: _thumbnail_debug_payload(thumbnail_service))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -2533,10 +3136,7 @@ def admin_thumbnails_debug():
 def get_user_theme():
     """Get current user's theme preference"""
     try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
-        theme = user_data.get('theme', 'dark')  # Default to dark
-        return jsonify({'theme': theme})
+        return jsonify({'theme': _get_user_theme(current_user.username)})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -2551,37 +3151,34 @@ def save_user_theme():
             return jsonify({'error': 'No JSON data provided'}), 400
             
         theme = data.get('theme', 'dark')
-        print(f"Saving theme '{theme}' for user '{current_user.username}'")
         
         # Validate theme value
         if theme not in ['light', 'dark']:
             return jsonify({'error': 'Invalid theme. Must be "light" or "dark"'}), 400
         
-        # Load current users config
-        users_data = load_users_config()
-        print(f"Loaded users data: {users_data}")
+        with _users_file_lock:
+            # Load current users config
+            users_data = load_users_config()
         
-        # Update user's theme preference
-        if current_user.username in users_data.get('admin_users', {}):
-            users_data['admin_users'][current_user.username]['theme'] = theme
-            print(f"Updated user theme to: {theme}")
+            # Update user's theme preference
+            if current_user.username in users_data.get('admin_users', {}):
+                users_data['admin_users'][current_user.username]['theme'] = theme
             
-            # Save back to file with proper formatting
-            try:
-                with open(USERS_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(users_data, f, indent=4, ensure_ascii=False)
-                print(f"Successfully saved theme to {USERS_FILE}")
+                # Save back to file (serialized once, then swapped into place atomically)
+                try:
+                    _atomic_write_json(USERS_FILE, users_data)
+                    logger.debug("Saved theme '%s' for user '%s'", theme, current_user.username)
                 
-                return jsonify({'success': True, 'theme': theme})
-            except Exception as write_error:
-                print(f"Error writing to file: {write_error}")
-                return jsonify({'error': f'Failed to save theme: {write_error}'}), 500
-        else:
-            print(f"User '{current_user.username}' not found in admin_users")
-            return jsonify({'error': 'User not found'}), 404
+                    return jsonify({'success': True, 'theme': theme})
+                except Exception as write_error:
+                    logger.error("Error writing theme to %s: %s", USERS_FILE, write_error)
+                    return jsonify({'error': f'Failed to save theme: {write_error}'}), 500
+            else:
+                logger.warning("Theme save for unknown user '%s'", current_user.username)
+                return jsonify({'error': 'User not found'}), 404
             
     except Exception as e:
-        print(f"Error in save_user_theme: {e}")
+        logger.error("Error in save_user_theme: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -2591,8 +3188,7 @@ def save_user_theme():
 def debug_user_data():
     """Debug endpoint to check current user data"""
     try:
-        users_data = load_users_config()
-        user_data = users_data.get('admin_users', {}).get(current_user.username, {})
+        user_data = _get_users_cached().get('admin_users', {}).get(current_user.username, {})
         return jsonify({
             'username': current_user.username,
             'user_data': user_data,
@@ -2602,6 +3198,45 @@ def debug_user_data():
         return jsonify({'error': str(e)}), 500
 
 
+def _init_obs_connection():
+    """Load saved OBS settings and bring up the persistent connection (runs off the startup path)"""
+    # Attempt auto-connection if settings exist
+    logger.info("📋 Checking for existing OBS settings...")
+    if obs_client.load_settings():
+        # load_settings() already logged the redacted settings at INFO
+        logger.debug("📋 Found OBS settings: %s", obs_client.settings_redacted_str)
+        
+        logger.info("📋 Forcing persistent OBS connection...")
+        try:
+            # CRITICAL: Enable all persistent connection flags FIRST
+            obs_client.auto_reconnect_enabled = True
+            obs_client.should_be_connected = True
+            logger.debug("🔧 Persistent connection flags set: auto_reconnect=True, should_be_connected=True")
+            
+            # Force enable persistent connection (this includes connection attempt)
+            obs_client.enable_persistent_connection()
+            
+            if obs_client.connected:
+                logger.info("✅ Connected to OBS - persistent connection active (monitoring: %s)",
+                            obs_client.auto_reconnect_enabled)
+            else:
+                logger.warning("⚠️  Initial OBS connection failed - connection monitor will keep retrying")
+                
+        except Exception as e:
+            logger.error("❌ OBS connection error during startup: %s", e)
+            logger.warning("🔄 Forcing reconnection monitor anyway...")
+            # CRITICAL: Always ensure the monitor is running if settings are enabled
+            try:
+                obs_client.auto_reconnect_enabled = True
+                obs_client.should_be_connected = True
+                obs_client._start_connection_monitor()
+                logger.info("✅ Connection monitor started - will reconnect when OBS is available")
+            except Exception as monitor_error:
+                logger.error("❌ Could not start OBS connection monitor: %s", monitor_error)
+    else:
+        logger.info("ℹ️  No OBS settings found - connection will be available when configured")
+
+
 if __name__ == '__main__':
     # Ensure required directories exist
     ANIMATIONS_DIR.mkdir(exist_ok=True)
@@ -2611,15 +3246,14 @@ if __name__ == '__main__':
     LOGS_DIR.mkdir(exist_ok=True)
     
     # Initialize state file if it doesn't exist
-    if not STATE_FILE.exists():
-        save_state({"current_animation": "anim1.html"})
+    ensure_state_file()
     
-    # Initialize users config if it doesn't exist
-    if not USERS_FILE.exists():
-        default_users = {
+    # Initialize users config if it doesn't exist (the password hash is only computed for a new file)
+    def default_users():
+        return {
             "admin_users": {
                 "admin": {
-                    "password": "admin123",
+                    "password_hash": generate_password_hash("admin123"),
                     "created_at": datetime.now().isoformat(),
                     "permissions": ["read", "write", "delete", "upload"],
                     "theme": "dark"
@@ -2630,8 +3264,8 @@ if __name__ == '__main__':
                 "remember_me_days": 7
             }
         }
-        with open(USERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(default_users, f, indent=2)
+    
+    _create_json_file(USERS_FILE, default_users)
     
     # Run the Flask-SocketIO server on all interfaces (0.0.0.0) port 8080
     print("OBS-TV-Animator WebSocket Server Starting...")
@@ -2683,13 +3317,8 @@ if __name__ == '__main__':
 def api_obs_settings_get():
     """Get OBS connection settings"""
     try:
-        # Create config path if it doesn't exist
-        obs_config_path = DATA_DIR / 'config' / 'obs_settings.json'
-        
-        if obs_config_path.exists():
-            with open(obs_config_path, 'r') as f:
-                settings = json.load(f)
-        else:
+        settings = read_obs_settings()
+        if settings is None:
             # Default settings
             settings = {
                 'host': 'localhost',
@@ -2721,14 +3350,8 @@ def api_obs_settings_post():
             'enabled': data.get('enabled', True)
         }
         
-        # Ensure config directory exists
-        config_dir = DATA_DIR / 'config'
-        config_dir.mkdir(exist_ok=True)
-        
         # Save settings
-        obs_config_path = config_dir / 'obs_settings.json'
-        with open(obs_config_path, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_obs_settings(settings)
         
         # Check if we need to restart the OBS client
         global obs_client
@@ -2737,17 +3360,16 @@ def api_obs_settings_post():
         # Check if settings actually changed significantly
         if obs_client and obs_client.settings:
             old_settings = obs_client.settings
-            if (old_settings.get('host') != settings['host'] or 
-                old_settings.get('port') != settings['port'] or 
-                old_settings.get('password') != settings['password']):
+            old_key = (old_settings.get('host'), old_settings.get('port'), old_settings.get('password'))
+            if old_key != (settings['host'], settings['port'], settings['password']):
                 needs_restart = True
-                print(f"🔄 Connection settings changed, restart required")
+                logger.info("🔄 Connection settings changed, restart required")
         else:
             needs_restart = True
-            print(f"🔄 No existing client or settings, initial connection required")
+            logger.info("🔄 No existing client or settings, initial connection required")
         
         if needs_restart:
-            print(f"🔄 Restarting OBS client with new settings...")
+            logger.info("🔄 Restarting OBS client with new settings...")
             
             # Disconnect old client if it exists (force because we're changing settings)
             if obs_client:
@@ -2761,15 +3383,15 @@ def api_obs_settings_post():
         
         # Always ensure connection if enabled (whether restart or not)
         if settings.get('enabled', True):
-            print(f"🔄 OBS connection enabled, ensuring persistent connection...")
+            logger.debug("🔄 OBS connection enabled, ensuring persistent connection...")
             if obs_client:
                 obs_client.enable_persistent_connection()
                 connected = obs_client.connected
-                print(f"🔄 Connection result: {connected}")
+                logger.debug("🔄 Connection result: %s", connected)
             else:
                 connected = False
         else:
-            print(f"🔄 OBS connection disabled in settings")
+            logger.debug("🔄 OBS connection disabled in settings")
             if obs_client:
                 obs_client.disconnect(permanent=True, force=True)  # Force because user disabled it
             connected = False
@@ -2784,28 +3406,7 @@ def api_obs_settings_post():
 def api_obs_mappings_get():
     """Get scene to animation mappings"""
     try:
-        # Create config path if it doesn't exist
-        mappings_path = DATA_DIR / 'config' / 'obs_mappings.json'
-        
-        if mappings_path.exists():
-            with open(mappings_path, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    try:
-                        mappings = json.loads(content)
-                        # Ensure it's a list
-                        if not isinstance(mappings, list):
-                            mappings = []
-                    except json.JSONDecodeError:
-                        # Handle malformed JSON
-                        mappings = []
-                else:
-                    # Handle empty file
-                    mappings = []
-        else:
-            mappings = []
-        
-        return jsonify({'success': True, 'mappings': mappings})
+        return jsonify({'success': True, 'mappings': read_obs_mappings()})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -2822,19 +3423,13 @@ def api_obs_mappings_post():
         
         mappings = data['mappings']
         
-        # Validate mappings structure
-        for mapping in mappings:
-            if not isinstance(mapping, dict) or 'sceneName' not in mapping or 'animation' not in mapping:
-                return jsonify({'success': False, 'error': 'Invalid mapping structure'}), 400
-        
-        # Ensure config directory exists
-        config_dir = DATA_DIR / 'config'
-        config_dir.mkdir(exist_ok=True)
+        # Validate mappings structure: a list of objects that each carry the required keys
+        if not isinstance(mappings, list) or not all(
+                isinstance(mapping, dict) and mapping.keys() >= OBS_MAPPING_REQUIRED_KEYS for mapping in mappings):
+            return jsonify({'success': False, 'error': 'Invalid mapping structure'}), 400
         
-        # Save mappings
-        mappings_path = config_dir / 'obs_mappings.json'
-        with open(mappings_path, 'w') as f:
-            json.dump(mappings, f, indent=2)
+        # Save mappings (_atomic_write_json creates the config directory if it is missing)
+        write_obs_mappings(mappings)
         
         return jsonify({'success': True})
     except Exception as e:
@@ -2845,47 +3440,39 @@ def api_obs_mappings_post():
 @admin_required
 def api_obs_test_connection():
     """Test OBS WebSocket connection"""
-    print("=== OBS Connection Test Started ===")
-    import time
+    logger.debug("=== OBS Connection Test Started ===")
     start_time = time.time()
     
     try:
-        print("Creating temporary OBS client for testing...")
+        logger.debug("Creating temporary OBS client for testing...")
         test_client = OBSWebSocketClient()
         
         # Load and log settings (without password)
         if test_client.load_settings():
-            settings_log = test_client.settings.copy()
-            if 'password' in settings_log and settings_log['password']:
-                settings_log['password'] = '[REDACTED]'
-            else:
-                settings_log['password'] = '[EMPTY]'
-            print(f"Loaded settings: {settings_log}")
+            logger.debug("Loaded settings: %s", test_client.settings_redacted_str)
         else:
-            print("❌ No OBS settings found!")
+            logger.error("❌ No OBS settings found!")
             return jsonify({'success': False, 'error': 'No OBS settings configured'})
         
-        print("Calling test_connection()...")
+        logger.debug("Calling test_connection()...")
         success, message = test_client.test_connection()
         
         duration = time.time() - start_time
-        print(f"Test completed in {duration:.2f} seconds")
+        logger.debug("Test completed in %.2f seconds", duration)
         
         if success:
-            print(f"✅ Connection successful: {message}")
+            logger.debug("✅ Connection successful: %s", message)
             return jsonify({'success': True, 'message': message})
         else:
-            print(f"❌ Connection failed: {message}")
+            logger.warning("❌ Connection failed: %s", message)
             return jsonify({'success': False, 'error': message})
             
     except Exception as e:
         duration = time.time() - start_time
-        print(f"❌ Exception during test after {duration:.2f} seconds: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Exception during test after %.2f seconds: %s", duration, e)
         return jsonify({'success': False, 'error': str(e)}), 500
     finally:
-        print("=== OBS Connection Test Complete ===")
+        logger.debug("=== OBS Connection Test Complete ===")
 
 
 @app.route('/api/obs/connect', methods=['POST'])
@@ -2915,6 +3502,23 @@ def api_obs_connect():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/obs/reconnect', methods=['POST'])
+@admin_required
+def api_obs_reconnect():
+    """Reconnect to OBS immediately, skipping any pending backoff delay"""
+    global obs_client
+    try:
+        if not obs_client:
+            obs_client = OBSWebSocketClient()
+        
+        if obs_client.force_reconnect():
+            return jsonify({'success': True, 'message': 'Reconnecting to OBS WebSocket server'})
+        return jsonify({'success': True, 'message': 'Already connected to OBS'})
+            
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/obs/disconnect', methods=['POST'])
 @admin_required
 def api_obs_disconnect():
@@ -2937,24 +3541,22 @@ def api_obs_status():
     """Get OBS WebSocket connection status"""
     global obs_client
     try:
-        print(f"📊 OBS Status Check - obs_client exists: {obs_client is not None}")
+        logger.debug("📊 OBS Status Check - obs_client exists: %s", obs_client is not None)
         
         # Check if OBS connection is enabled in settings
-        obs_config_path = DATA_DIR / 'config' / 'obs_settings.json'
         obs_enabled = True  # Default to enabled
         
-        if obs_config_path.exists():
-            try:
-                with open(obs_config_path, 'r') as f:
-                    settings = json.load(f)
-                    obs_enabled = settings.get('enabled', True)
-                    print(f"📊 OBS Connection enabled in settings: {obs_enabled}")
-            except Exception as e:
-                print(f"📊 Error reading settings: {e}")
+        try:
+            settings = read_obs_settings()
+            if settings is not None:
+                obs_enabled = settings.get('enabled', True)
+                logger.debug("📊 OBS Connection enabled in settings: %s", obs_enabled)
+        except Exception as e:
+            logger.warning("📊 Error reading settings: %s", e)
         
         # If connection is disabled, return disconnected status
         if not obs_enabled:
-            print("📊 OBS Connection is disabled by user")
+            logger.debug("📊 OBS Connection is disabled by user")
             return jsonify({
                 'success': True, 
                 'connected': False,
@@ -2965,45 +3567,46 @@ def api_obs_status():
         
         # If obs_client doesn't exist, try to initialize it ONCE
         if obs_client is None:
-            print("🔧 obs_client is None, attempting to initialize...")
+            logger.debug("🔧 obs_client is None, attempting to initialize...")
             try:
                 obs_client = OBSWebSocketClient()
-                print("✅ OBS client created successfully")
+                logger.debug("✅ OBS client created successfully")
                 
                 # Check for settings and enable persistent connection
                 if obs_client.load_settings():
-                    print("📋 Settings loaded, enabling persistent connection...")
+                    logger.debug("📋 Settings loaded, enabling persistent connection...")
                     obs_client.enable_persistent_connection()
-                    print(f"📋 Persistent connection enabled. Connected: {obs_client.connected}")
+                    logger.debug("📋 Persistent connection enabled. Connected: %s", obs_client.connected)
                 else:
-                    print("⚠️ No OBS settings found")
+                    logger.warning("⚠️ No OBS settings found")
             except Exception as init_error:
-                print(f"❌ Failed to initialize obs_client: {init_error}")
+                logger.error("❌ Failed to initialize obs_client: %s", init_error)
                 obs_client = None
         elif obs_client and not obs_client.should_be_connected and obs_enabled:
             # If we have a client but it's not set to be connected, but settings say it should be
-            print("🔧 Re-enabling persistent connection for existing client...")
+            logger.debug("🔧 Re-enabling persistent connection for existing client...")
             obs_client.enable_persistent_connection()
         
         if obs_client:
-            print(f"📊 OBS Status - connected: {obs_client.connected}, should_be_connected: {obs_client.should_be_connected}")
+            logger.debug("📊 OBS Status - connected: %s, should_be_connected: %s", obs_client.connected, obs_client.should_be_connected)
         
         if obs_client and obs_client.connected:
-            # Verify connection is actually working by trying to get data
+            # Scene data comes from the client's snapshot (refreshed from OBS when stale); a failed
+            # refresh means the connection is broken
             try:
-                print(f"📊 Testing connection health by requesting scene data...")
-                current_scene = obs_client.get_current_scene()
-                scene_list = obs_client.get_scene_list()
+                logger.debug("📊 Requesting scene data...")
+                current_scene, scene_list = obs_client.get_cached_scene_overview()
                 
-                print(f"📊 Connection test successful - Current scene: {current_scene}, Scene count: {len(scene_list) if scene_list else 0}")
+                logger.debug("📊 Connection test successful - Current scene: %s, Scene count: %s", current_scene, len(scene_list) if scene_list else 0)
                 
-                # Save current scene to persistent storage if we have data
-                if current_scene:
+                # Save current scene to persistent storage if it differs from what is stored
+                # (the stored copy is served from the JSON cache, so polls with no change cost a stat)
+                if current_scene and current_scene != read_current_scene_data()['current_scene']:
                     try:
                         obs_client._save_current_scene_to_storage(current_scene)
-                        print(f"💾 Updated persistent storage with current scene: {current_scene}")
+                        logger.debug("💾 Queued persistent storage update with current scene: %s", current_scene)
                     except Exception as storage_error:
-                        print(f"⚠️ Failed to update storage in status check: {storage_error}")
+                        logger.warning("⚠️ Failed to update storage in status check: %s", storage_error)
                 
                 # Note: Scene list is only updated manually via UI refresh button
                 # We don't need automatic scene list updates in the backend
@@ -3016,7 +3619,7 @@ def api_obs_status():
                     'scene_list': scene_list  # Still return it for immediate UI display
                 })
             except Exception as e:
-                print(f"📊 OBS Status - Connection test failed: {e}")
+                logger.warning("📊 OBS Status - Connection test failed: %s", e)
                 # Connection is broken, update the client status
                 obs_client.connected = False
                 
@@ -3054,7 +3657,7 @@ def api_obs_scenes():
     try:
         if obs_client and obs_client.connected:
             scene_list = obs_client.get_scene_list()
-            print(f"📋 Fetched scene list for UI: {len(scene_list) if scene_list else 0} scenes")
+            logger.debug("📋 Fetched scene list for UI: %s scenes", len(scene_list) if scene_list else 0)
             return jsonify({'success': True, 'scenes': scene_list})
         else:
             return jsonify({'success': False, 'error': 'Not connected to OBS'})
@@ -3068,20 +3671,7 @@ def api_obs_scenes():
 def api_obs_current_scene_get():
     """Get current scene data from persistent storage"""
     try:
-        current_scene_path = DATA_DIR / 'config' / 'obs_current_scene.json'
-        
-        if current_scene_path.exists():
-            with open(current_scene_path, 'r') as f:
-                scene_data = json.load(f)
-        else:
-            # Default data if file doesn't exist
-            scene_data = {
-                'current_scene': None,
-                'last_updated': None,
-                'scene_list': []
-            }
-        
-        return jsonify({'success': True, 'scene_data': scene_data})
+        return jsonify({'success': True, 'scene_data': read_current_scene_data()})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -3096,38 +3686,11 @@ def api_obs_current_scene_post():
         if not data:
             return jsonify({'success': False, 'error': 'No data provided'}), 400
         
-        # Load existing data (minimal structure - no scene_list)
-        current_scene_path = DATA_DIR / 'config' / 'obs_current_scene.json'
-        if current_scene_path.exists():
-            with open(current_scene_path, 'r') as f:
-                loaded_data = json.load(f)
-                # Only preserve current_scene and last_updated, ignore scene_list
-                scene_data = {
-                    'current_scene': loaded_data.get('current_scene'),
-                    'last_updated': loaded_data.get('last_updated')
-                }
-        else:
-            scene_data = {
-                'current_scene': None,
-                'last_updated': None
-            }
-        
-        # Update with new data (current_scene only - ignore scene_list)
+        # Update with new data (current_scene only - scene_list is intentionally not stored)
         if 'current_scene' in data:
-            scene_data['current_scene'] = data['current_scene']
-            scene_data['last_updated'] = datetime.now().isoformat()
-        
-        # Note: We intentionally ignore scene_list updates - not stored permanently
-        
-
-        
-        # Ensure config directory exists
-        config_dir = DATA_DIR / 'config'
-        config_dir.mkdir(exist_ok=True)
-        
-        # Save updated data
-        with open(current_scene_path, 'w') as f:
-            json.dump(scene_data, f, indent=2)
+            scene_data = write_current_scene(data['current_scene'])
+        else:
+            scene_data = read_current_scene_data()
         
         return jsonify({'success': True, 'scene_data': scene_data})
     except Exception as e:
@@ -3151,15 +3714,14 @@ if __name__ == '__main__':
     ensure_state_file()
     
     # Create default admin user if users.json doesn't exist
-    if not USERS_FILE.exists():
+    def default_users():
         print("Creating default admin user configuration...")
         
         # Generate secure random passwords for default users
-        import secrets
         admin_password = secrets.token_urlsafe(12)  # Strong random password
         viewer_password = secrets.token_urlsafe(8)   # Simpler random password
         
-        default_users = {
+        return {
             "admin": {
                 "password": admin_password,
                 "role": "admin",
@@ -3184,8 +3746,8 @@ if __name__ == '__main__':
                 "remember_me_days": 7
             }
         }
-        with open(USERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(default_users, f, indent=2)
+    
+    _create_json_file(USERS_FILE, default_users)
     
     # Run the Flask-SocketIO server on all interfaces (0.0.0.0) port 8080
     print("OBS-TV-Animator WebSocket Server Starting...")
@@ -3227,6 +3789,7 @@ if __name__ == '__main__':
     print("  • Visit /admin/instructions/getting-started for complete guide")
     print("=" * 84)
 
+    trigger_socket = None
     try:
         # Initialize file trigger watcher for StreamerBot
         print("🔍 Starting file trigger watcher...")
@@ -3235,78 +3798,45 @@ if __name__ == '__main__':
         file_watcher.start_watching()
         print("✓ File trigger watcher started")
         
+        # Unix socket trigger listener (file watcher stays as the Windows fallback)
+        trigger_socket = TriggerSocketListener(TRIGGER_SOCKET_PATH, file_watcher._handle_trigger)
+        if trigger_socket.start_listening():
+            print(f"✓ Trigger socket listening at {TRIGGER_SOCKET_PATH}")
+        
         # Initialize OBS Scene Watcher for automatic animation triggering
         print("🎬 Starting OBS Scene Watcher...")
-        obs_scene_file = DATA_DIR / "config" / "obs_current_scene.json"
-        obs_mappings_file = DATA_DIR / "config" / "obs_mappings.json"
-        obs_scene_watcher = OBSSceneWatcher(str(obs_scene_file), str(obs_mappings_file))
+        obs_scene_watcher = OBSSceneWatcher(str(OBS_CURRENT_SCENE_FILE), str(OBS_MAPPINGS_FILE))
         obs_scene_watcher.start_watching()
         print("✓ OBS Scene Watcher started")
         
         # Start the raw WebSocket server for StreamerBot
         print(f"🚀 Starting Raw WebSocket server on port {WEBSOCKET_PORT} for StreamerBot...")
         try:
-            websocket_thread = raw_websocket_server.start_server()
-            print("✓ Raw WebSocket server started successfully")
+            websocket_ready = raw_websocket_server.start_server()
+            if websocket_ready.wait(timeout=5):
+                print("✓ Raw WebSocket server ready!")
+            else:
+                print("⚠️  Raw WebSocket server not bound yet, continuing startup...")
         except Exception as e:
             print(f"❌ Error starting Raw WebSocket server: {e}")
             print("⚠️  Continuing without Raw WebSocket server...")
         
-        # Give the WebSocket server a moment to start
-        import time
-        time.sleep(1)
-        print("✓ Raw WebSocket server ready!")
         
-        # Initialize OBS WebSocket client (will attempt connection if settings exist)
+        # Initialize OBS WebSocket client; connecting can block on socket timeouts, so it
+        # happens in the background while Flask starts serving (status routes report disconnected meanwhile)
         print("🎬 Initializing OBS WebSocket client...")
         obs_client = OBSWebSocketClient()
         print("✓ OBS WebSocket client initialized")
-        
-        # Attempt auto-connection if settings exist
-        print("📋 Checking for existing OBS settings...")
-        if obs_client.load_settings():
-            # Log the loaded settings for debugging (without password)
-            settings_debug = obs_client.settings.copy()
-            if 'password' in settings_debug:
-                settings_debug['password'] = '[REDACTED]' if settings_debug['password'] else '[EMPTY]'
-            print(f"📋 Found OBS settings: {settings_debug}")
-            
-            print("📋 FORCING PERSISTENT OBS CONNECTION...")
-            try:
-                # CRITICAL: Enable all persistent connection flags FIRST
-                obs_client.auto_reconnect_enabled = True
-                obs_client.should_be_connected = True
-                print("🔧 Persistent connection flags set: auto_reconnect=True, should_be_connected=True")
-                
-                # Force enable persistent connection (this includes connection attempt)
-                obs_client.enable_persistent_connection()
-                
-                if obs_client.connected:
-                    print("✅ SUCCESSFULLY CONNECTED TO OBS - PERSISTENT CONNECTION ACTIVE")
-                    print(f"✅ Connection monitoring active: {obs_client.auto_reconnect_enabled}")
-                else:
-                    print("⚠️  Initial connection failed but PERSISTENT RECONNECTION IS ACTIVE")
-                    print("🔄 Connection monitor will continuously attempt reconnection...")
-                    
-            except Exception as e:
-                print(f"❌ CRITICAL: OBS connection error during startup: {e}")
-                print("� FORCING RECONNECTION MONITOR ANYWAY...")
-                # CRITICAL: Always ensure the monitor is running if settings are enabled
-                try:
-                    obs_client.auto_reconnect_enabled = True
-                    obs_client.should_be_connected = True
-                    obs_client._start_connection_monitor()
-                    print("✅ FORCED connection monitor started - will reconnect when OBS available")
-                except Exception as monitor_error:
-                    print(f"❌ FATAL: Could not start connection monitor: {monitor_error}")
-        else:
-            print("ℹ️  No OBS settings found - connection will be available when configured")
+        threading.Thread(target=_init_obs_connection, name='obs-init', daemon=True).start()
         
         print("🚀 Starting Flask-SocketIO server...")
         socketio.run(app, host='0.0.0.0', port=MAIN_PORT, debug=False, allow_unsafe_werkzeug=True)
         
     except Exception as e:
         print(f"❌ FATAL ERROR during startup: {e}")
-        import traceback
         traceback.print_exc()
         print("⚠️  Server startup failed!")
+    finally:
+        if trigger_socket:
+            trigger_socket.stop_listening()
+        stop_background_loop()
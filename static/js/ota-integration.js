@@ -104,14 +104,15 @@ class OTAIntegration {
                 
                 // Auto-refresh page if requested (for seamless media changes)
                 if (this.options.enablePageRefresh && data.refresh_page) {
-                    console.log('Page refresh requested, reloading in ' + this.options.animationChangeDelay + 'ms...');
+                    console.log('Page refresh requested, reloading in ' + this.options.refreshDelay + 'ms...');
+                    this.showRefreshNotification(data);
                     setTimeout(() => {
                         window.location.reload();
-                    }, this.options.animationChangeDelay);
+                    }, this.options.refreshDelay);
                 }
             });
             
-            // Listen for explicit page refresh commands
+            // Legacy explicit page refresh command (the server now sends refresh_page with animation_changed)
             this.socket.on('page_refresh', (data) => {
                 console.log('Page refresh command received:', data);
                 
@@ -73,14 +73,15 @@ class VideoPlayer {
                 
                 // Auto-refresh page if requested (for seamless media changes)
                 if (data.refresh_page) {
-                    console.log('Page refresh requested, reloading in 1 second...');
+                    console.log('Page refresh requested, reloading in 500ms...');
+                    this.showRefreshNotification(data);
                     setTimeout(() => {
                         window.location.reload();
-                    }, 1000);
+                    }, 500);
                 }
             });
             
-            // Listen for explicit page refresh commands
+            // Legacy explicit page refresh command (the server now sends refresh_page with animation_changed)
             this.socket.on('page_refresh', (data) => {
                 console.log('Page refresh command received:', data);
                 this.showRefreshNotification(data);
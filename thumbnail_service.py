@@ -15,6 +15,8 @@ from typing import Optional, Tuple
 from urllib.parse import urljoin
 import hashlib
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 try:
     from playwright.async_api import async_playwright
@@ -23,6 +25,22 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logging.warning("Playwright not available - HTML thumbnail generation disabled")
 
+# File types thumbnails can be generated for (lowercase, with the leading dot)
+THUMBNAIL_HTML_EXTENSIONS = frozenset({'.html', '.htm'})
+THUMBNAIL_VIDEO_EXTENSIONS = frozenset({'.mp4', '.webm', '.mov', '.avi', '.mkv'})
+
+# Shared, bounded pool for blocking FFmpeg runs so they never stall the event loop
+# or compete with other users of the loop's default executor
+_thumbnail_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='thumbnail')
+
+@lru_cache(maxsize=1024)
+def _thumbnail_name(filename: str) -> str:
+    """Thumbnail file name for a media file (memoized; every lookup and listing recomputes it)"""
+    # Create hash of filename to avoid filesystem issues
+    name_hash = hashlib.md5(filename.encode()).hexdigest()[:8]
+    safe_name = "".join(c for c in filename if c.isalnum() or c in ".-_")[:50]
+    return f"{safe_name}_{name_hash}.png"
+
 class ThumbnailService:
     """Service for generating thumbnails from HTML animations and videos"""
     
@@ -42,14 +60,14 @@ class ThumbnailService:
         self.video_thumbnail_width = 320
         self.video_thumbnail_height = 180
         self.video_capture_time = "00:00:01"  # Capture at 1 second mark
+        
+        # Bumped whenever a thumbnail is written or removed; overwriting a file in place
+        # does not change the directory mtime, so callers use this to detect changes
+        self.generation = 0
     
     def get_thumbnail_path(self, filename: str) -> Path:
         """Get the path where thumbnail should be saved"""
-        # Create hash of filename to avoid filesystem issues
-        name_hash = hashlib.md5(filename.encode()).hexdigest()[:8]
-        safe_name = "".join(c for c in filename if c.isalnum() or c in ".-_")[:50]
-        thumbnail_name = f"{safe_name}_{name_hash}.png"
-        return self.thumbnails_dir / thumbnail_name
+        return self.thumbnails_dir / _thumbnail_name(filename)
     
     def thumbnail_exists(self, filename: str, source_path: Path) -> bool:
         """Check if thumbnail exists and is newer than source file"""
@@ -128,6 +146,7 @@ class ThumbnailService:
                     )
                     
                     self.logger.info(f"Successfully generated HTML thumbnail: {thumbnail_path}")
+                    self.generation += 1
                     return True
                     
                 finally:
@@ -162,6 +181,8 @@ class ThumbnailService:
                 '-ss', self.video_capture_time,
                 '-vframes', '1',
                 '-vf', f'scale={self.video_thumbnail_width}:{self.video_thumbnail_height}',
+                '-threads', '1',  # One frame doesn't need every core; keeps parallel captures from thrashing
+                '-filter_threads', '1',
                 '-y',  # Overwrite output file
                 str(thumbnail_path)
             ]
@@ -176,6 +197,7 @@ class ThumbnailService:
             
             if result.returncode == 0:
                 self.logger.info(f"Successfully generated video thumbnail: {thumbnail_path}")
+                self.generation += 1
                 return True
             else:
                 self.logger.error(f"FFmpeg failed for {filename}: {result.stderr}")
@@ -199,13 +221,13 @@ class ThumbnailService:
         Generate appropriate thumbnail based on file type
         Returns (success: bool, thumbnail_filename: str)
         """
-        file_ext = filename.lower().split('.')[-1]
+        file_ext = os.path.splitext(filename)[1].lower()
         
-        if file_ext in ['html', 'htm']:
+        if file_ext in THUMBNAIL_HTML_EXTENSIONS:
             success = await self.generate_html_thumbnail(filename, file_path)
-        elif file_ext in ['mp4', 'webm', 'mov', 'avi', 'mkv']:
-            success = await asyncio.get_event_loop().run_in_executor(
-                None, self.generate_video_thumbnail, filename, file_path
+        elif file_ext in THUMBNAIL_VIDEO_EXTENSIONS:
+            success = await asyncio.get_running_loop().run_in_executor(
+                _thumbnail_pool, self.generate_video_thumbnail, filename, file_path
             )
         else:
             self.logger.warning(f"Unsupported file type for thumbnail: {filename}")
@@ -268,8 +290,8 @@ class ThumbnailService:
                             results['video_skipped'] += 1
                             continue
                         
-                        success = await asyncio.get_event_loop().run_in_executor(
-                            None, self.generate_video_thumbnail, video_file.name, video_file
+                        success = await asyncio.get_running_loop().run_in_executor(
+                            _thumbnail_pool, self.generate_video_thumbnail, video_file.name, video_file
                         )
                         if success:
                             results['video_generated'] += 1
@@ -286,35 +308,28 @@ class ThumbnailService:
         """Remove thumbnails for files that no longer exist"""
         cleaned_count = 0
         
-        # Get list of all existing files
-        existing_files = set()
-        
-        if animations_dir.exists():
-            existing_files.update(f.name for f in animations_dir.glob('*.html'))
+        # Thumbnail names every existing media file maps to (one scandir per directory)
+        expected = set()
+        for directory, extensions in ((animations_dir, THUMBNAIL_HTML_EXTENSIONS),
+                                      (videos_dir, THUMBNAIL_VIDEO_EXTENSIONS)):
+            if directory.exists():
+                with os.scandir(directory) as entries:
+                    expected.update(_thumbnail_name(entry.name) for entry in entries
+                                    if os.path.splitext(entry.name)[1].lower() in extensions)
         
-        if videos_dir.exists():
-            video_extensions = ['*.mp4', '*.webm', '*.mov', '*.avi', '*.mkv']
-            for pattern in video_extensions:
-                existing_files.update(f.name for f in videos_dir.glob(pattern))
+        # Any thumbnail not in that set belongs to a file that has gone away
+        with os.scandir(self.thumbnails_dir) as entries:
+            orphans = [entry for entry in entries
+                       if entry.name.endswith('.png') and entry.name not in expected]
         
-        # Check each thumbnail
-        for thumbnail_file in self.thumbnails_dir.glob('*.png'):
-            # Try to match thumbnail back to original file
-            # This is approximate since we hash filenames
-            found_match = False
-            
-            for existing_file in existing_files:
-                if self.get_thumbnail_path(existing_file).name == thumbnail_file.name:
-                    found_match = True
-                    break
-            
-            if not found_match:
-                try:
-                    thumbnail_file.unlink()
-                    cleaned_count += 1
-                    self.logger.info(f"Removed orphaned thumbnail: {thumbnail_file.name}")
-                except OSError as e:
-                    self.logger.error(f"Failed to remove thumbnail {thumbnail_file.name}: {str(e)}")
+        for thumbnail_file in orphans:
+            try:
+                os.unlink(thumbnail_file.path)
+                cleaned_count += 1
+                self.generation += 1
+                self.logger.info(f"Removed orphaned thumbnail: {thumbnail_file.name}")
+            except OSError as e:
+                self.logger.error(f"Failed to remove thumbnail {thumbnail_file.name}: {str(e)}")
         
         return cleaned_count
 
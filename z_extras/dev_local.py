@@ -61,7 +61,8 @@ if __name__ == '__main__':
         # Only initialize automation in the main process, not in reloader child process
         if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
             # Import automation components inside main block to avoid double initialization
-            from app import DATA_DIR, TriggerFileWatcher, OBSSceneWatcher, OBSWebSocketClient
+            from app import (DATA_DIR, OBS_CURRENT_SCENE_FILE, OBS_MAPPINGS_FILE, TRIGGER_SOCKET_PATH,
+                             TriggerFileWatcher, TriggerSocketListener, OBSSceneWatcher, OBSWebSocketClient)
             import app as app_module
             
             # Initialize automation features for development
@@ -74,11 +75,14 @@ if __name__ == '__main__':
             file_watcher.start_watching()
             print("✓ File trigger watcher started")
             
+            # Unix socket trigger listener (file watcher stays as the Windows fallback)
+            trigger_socket = TriggerSocketListener(TRIGGER_SOCKET_PATH, file_watcher._handle_trigger)
+            if trigger_socket.start_listening():
+                print(f"✓ Trigger socket listening at {TRIGGER_SOCKET_PATH}")
+            
             # Initialize OBS Scene Watcher for automatic animation triggering
             print("🎬 Starting OBS Scene Watcher...")
-            obs_scene_file = DATA_DIR / "config" / "obs_current_scene.json"
-            obs_mappings_file = DATA_DIR / "config" / "obs_mappings.json"
-            app_module.obs_scene_watcher = OBSSceneWatcher(str(obs_scene_file), str(obs_mappings_file))
+            app_module.obs_scene_watcher = OBSSceneWatcher(str(OBS_CURRENT_SCENE_FILE), str(OBS_MAPPINGS_FILE))
             app_module.obs_scene_watcher.start_watching()
             print("✓ OBS Scene Watcher started")
             